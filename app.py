@@ -12,10 +12,15 @@ if sys.platform.startswith("win"):
         except Exception:
             pass
 
+import hashlib
+import json
+
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from models import db_to_dict
 from storage import Storage
+from utils import SCROLL_WHEEL_TAG
 from ui_explorer import ExplorerView
 from ui_file_view import FileView
 
@@ -34,6 +39,16 @@ class App(tk.Tk):
         self.storage = Storage("data.json")
         self.db = self.storage.load_or_create_blank()
 
+        # Debounced save state: rapid edits coalesce into one write, and a
+        # content hash lets us skip rewriting the file when nothing changed.
+        self._save_pending = None
+        self._last_saved_hash = None
+
+        # Views can report which node ids changed; when every change in a
+        # burst named its nodes we flush only those shards + the index.
+        self._dirty_ids: set[str] = set()
+        self._dirty_all = False
+
         self._build_ui()
         self._install_global_mousewheel()
 
@@ -77,9 +92,42 @@ class App(tk.Tk):
         # No status UI anywhere
         return
 
-    def _on_db_changed(self):
+    def _on_db_changed(self, *dirty_ids: str):
+        if dirty_ids:
+            self._dirty_ids.update(dirty_ids)
+        else:
+            # caller didn't say what changed - be safe and rewrite everything
+            self._dirty_all = True
+        if self._save_pending is not None:
+            try:
+                self.after_cancel(self._save_pending)
+            except Exception:
+                pass
+        self._save_pending = self.after(500, self._flush_save)
+
+    def _flush_save(self):
+        self._save_pending = None
+        # save_async only enqueues, so a disk failure surfaces on the writer
+        # thread after the fact - report the previous one before queueing more
+        err = self.storage.take_write_error()
+        if err is not None:
+            messagebox.showerror("Save error", f"Could not save data:\n\n{err}")
+        dirty_all = self._dirty_all
+        dirty_ids = self._dirty_ids
+        self._dirty_all = False
+        self._dirty_ids = set()
         try:
-            self.storage.save(self.db)
+            if dirty_ids and not dirty_all:
+                self.storage.save_async(self.db, dirty_ids)
+                self._last_saved_hash = None  # full-DB hash is stale now
+                return
+            data = db_to_dict(self.db)
+            buf = json.dumps(data, separators=(",", ":"), sort_keys=True).encode("utf-8")
+            h = hashlib.blake2b(buf, digest_size=16).digest()
+            if h == self._last_saved_hash:
+                return
+            self.storage.save_async(self.db)
+            self._last_saved_hash = h
         except Exception as e:
             messagebox.showerror("Save error", f"Could not save data:\n\n{e}")
 
@@ -96,26 +144,29 @@ class App(tk.Tk):
         self.explorer.tkraise()
 
     def on_close(self):
+        # Synchronous flush: don't leave a debounced save pending.
+        if self._save_pending is not None:
+            try:
+                self.after_cancel(self._save_pending)
+            except Exception:
+                pass
+            self._save_pending = None
         try:
-            self.storage.save(self.db)
-        except Exception:
-            pass
+            self.storage.save_async(self.db)
+            self.storage.flush()  # raises if the final write failed
+        except Exception as e:
+            messagebox.showerror("Save error", f"Could not save data:\n\n{e}")
         self.destroy()
 
-    # ---- Global mousewheel scrolling (works anywhere scrollable) ----
+    # ---- Mousewheel scrolling for registered scrollable widgets ----
+    # One binding per event on the shared ScrollableWheel bindtag; widgets
+    # opt in via utils.register_scrollable. event.widget is the widget under
+    # the pointer, so there is no winfo_containing hit-test per wheel tick.
     def _install_global_mousewheel(self):
-        self.bind_all("<MouseWheel>", self._on_global_mousewheel, add="+")
-        self.bind_all("<Shift-MouseWheel>", self._on_global_shift_mousewheel, add="+")
-        self.bind_all("<Button-4>", self._on_global_linux_wheel_up, add="+")
-        self.bind_all("<Button-5>", self._on_global_linux_wheel_down, add="+")
-
-    def _find_scroll_target(self, widget):
-        w = widget
-        while w is not None:
-            if hasattr(w, "yview") and callable(getattr(w, "yview")):
-                return w
-            w = w.master
-        return None
+        self.bind_class(SCROLL_WHEEL_TAG, "<MouseWheel>", self._on_wheel)
+        self.bind_class(SCROLL_WHEEL_TAG, "<Shift-MouseWheel>", self._on_shift_wheel)
+        self.bind_class(SCROLL_WHEEL_TAG, "<Button-4>", self._on_wheel_up)
+        self.bind_class(SCROLL_WHEEL_TAG, "<Button-5>", self._on_wheel_down)
 
     def _scroll_widget(self, w, units: int):
         try:
@@ -130,27 +181,17 @@ class App(tk.Tk):
         except Exception:
             pass
 
-    def _on_global_mousewheel(self, event):
-        target = self._find_scroll_target(self.winfo_containing(event.x_root, event.y_root))
-        if not target:
-            return
-        self._scroll_widget(target, -3 if event.delta > 0 else 3)
-
-    def _on_global_shift_mousewheel(self, event):
-        target = self._find_scroll_target(self.winfo_containing(event.x_root, event.y_root))
-        if not target:
-            return
-        self._scroll_widget_x(target, -3 if event.delta > 0 else 3)
-
-    def _on_global_linux_wheel_up(self, event):
-        target = self._find_scroll_target(self.winfo_containing(event.x_root, event.y_root))
-        if target:
-            self._scroll_widget(target, -3)
-
-    def _on_global_linux_wheel_down(self, event):
-        target = self._find_scroll_target(self.winfo_containing(event.x_root, event.y_root))
-        if target:
-            self._scroll_widget(target, 3)
+    def _on_wheel(self, event):
+        self._scroll_widget(event.widget, -3 if event.delta > 0 else 3)
+
+    def _on_shift_wheel(self, event):
+        self._scroll_widget_x(event.widget, -3 if event.delta > 0 else 3)
+
+    def _on_wheel_up(self, event):
+        self._scroll_widget(event.widget, -3)
+
+    def _on_wheel_down(self, event):
+        self._scroll_widget(event.widget, 3)
 
 
 if __name__ == "__main__":
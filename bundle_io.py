@@ -2,47 +2,100 @@
 # bundle_io.py
 from __future__ import annotations
 import json
+import os
 from typing import Dict, Any, List, Tuple
-from models import Database, Node, new_id
+from models import Database, Node, new_id, _upgrade_legacy_content
+
+try:
+    # Much faster JSON encode/decode (Rust). Optional - stdlib json still works.
+    import orjson
+except ImportError:
+    orjson = None
 
 def _collect_subtree(db: Database, node_id: str) -> List[str]:
-    out = []
-    def walk(nid: str):
-        if nid not in db.nodes:
-            return
+    # Iterative DFS: no recursion limit on deep trees, no per-level frames.
+    out: List[str] = []
+    nodes = db.nodes
+    stack = [node_id]
+    while stack:
+        nid = stack.pop()
+        n = nodes.get(nid)
+        if n is None:
+            continue
         out.append(nid)
-        n = db.nodes[nid]
         if n.type == "folder":
-            for cid in n.children:
-                walk(cid)
-    walk(node_id)
+            # reversed keeps the original pre-order (children first to last)
+            stack.extend(reversed(n.children))
     return out
 
+def _dumps_compact(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _loads(raw) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _node_to_raw(n: Node) -> Dict[str, Any]:
+    # raw-ish dict (compatible with our db format)
+    return {
+        "id": n.id,
+        "type": n.type,
+        "name": n.name,
+        "children": list(n.children),
+        "content": None if n.type != "file" else {
+            "read_doc": n.content.read_doc if n.content else {"text": "", "tags": []},
+            "copy_docs": n.content.copy_docs if n.content else [{"text": "", "tags": []}],
+        }
+    }
+
 def export_bundle(db: Database, folder_id: str) -> Dict[str, Any]:
     ids = _collect_subtree(db, folder_id)
-    nodes = {}
-    for nid in ids:
-        n = db.nodes[nid]
-        # store raw-ish dict (compatible with our db format)
-        nodes[nid] = {
-            "id": n.id,
-            "type": n.type,
-            "name": n.name,
-            "children": list(n.children),
-            "content": None if n.type == "folder" else {
-                "read_rich": n.content.read_rich if n.content else {"text":"", "tags":[]},
-                "copy_blocks": n.content.copy_blocks if n.content else [{"text":"", "tags":[]}],
-            }
-        }
-    return {"bundle_root_id": folder_id, "nodes": nodes}
+    return {"bundle_root_id": folder_id, "nodes": {nid: _node_to_raw(db.nodes[nid]) for nid in ids}}
 
-def save_bundle(path: str, bundle: Dict[str, Any]):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(bundle, f, indent=2, ensure_ascii=False)
+def save_bundle(path: str, db: Database, folder_id: str):
+    """
+    Stream the subtree as newline-delimited JSON: a header line holding
+    bundle_root_id, then one node per line. Never materializes the whole
+    bundle in memory.
+    """
+    with open(path, "wb") as f:
+        f.write(_dumps_compact({"bundle_root_id": folder_id}))
+        f.write(b"\n")
+        for nid in _collect_subtree(db, folder_id):
+            f.write(_dumps_compact(_node_to_raw(db.nodes[nid])))
+            f.write(b"\n")
 
 def load_bundle(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """
+    Reads either format:
+      - NDJSON bundles (header line then one node per line), parsed line
+        by line so the full file text is never held at once;
+      - legacy single-document bundles ({"bundle_root_id":..., "nodes":{...}}).
+    Returns the dict shape import_bundle_into_folder expects.
+    """
+    with open(path, "rb") as f:
+        first = f.readline()
+        try:
+            head = _loads(first)
+        except Exception:
+            head = None
+
+        if isinstance(head, dict) and "nodes" not in head:
+            # NDJSON: header first, then nodes one per line
+            nodes: Dict[str, Any] = {}
+            for line in f:
+                if not line.strip():
+                    continue
+                d = _loads(line)
+                if isinstance(d, dict) and d.get("id"):
+                    nodes[d["id"]] = d
+            return {"bundle_root_id": head.get("bundle_root_id"), "nodes": nodes}
+
+        # legacy single JSON document (possibly pretty-printed)
+        return _loads(first + f.read())
 
 def import_bundle_into_folder(db: Database, bundle: Dict[str, Any], target_folder_id: str) -> Tuple[bool, str]:
     if target_folder_id not in db.nodes or db.nodes[target_folder_id].type != "folder":
@@ -53,10 +106,13 @@ def import_bundle_into_folder(db: Database, bundle: Dict[str, Any], target_folde
     if not nodes_raw or not bundle_root_id or bundle_root_id not in nodes_raw:
         return False, "Bundle is missing required data."
 
-    # Remap IDs to avoid collisions
-    id_map: Dict[str, str] = {}
-    for old_id in nodes_raw.keys():
-        id_map[old_id] = new_id()
+    # Remap IDs to avoid collisions. Read the entropy for every ID in one
+    # urandom call and slice it into token_hex-style IDs (see models.new_id).
+    raw = os.urandom(16 * len(nodes_raw))
+    id_map: Dict[str, str] = {
+        old_id: raw[i * 16:(i + 1) * 16].hex()
+        for i, old_id in enumerate(nodes_raw)
+    }
 
     # Create nodes
     for old_id, d in nodes_raw.items():
@@ -64,11 +120,6 @@ def import_bundle_into_folder(db: Database, bundle: Dict[str, Any], target_folde
         ntype = d.get("type", "folder")
         name = d.get("name", "Imported")
         children = [id_map[c] for c in d.get("children", []) if c in id_map]
-        content = None
-        if ntype == "file":
-            c = d.get("content") or {}
-            content = c  # stored in same shape our models understand
-        # Build Node using our models shape
         node = Node(
             id=newnid,
             type=ntype,
@@ -77,33 +128,22 @@ def import_bundle_into_folder(db: Database, bundle: Dict[str, Any], target_folde
             content=None,
         )
         if ntype == "file":
-            # content is dict; ui/models will upgrade on save/load, but we want runtime content:
-            # quick minimal conversion:
-            from models import FileContent, blank_rich
-            read_rich = c.get("read_rich") if isinstance(c.get("read_rich"), dict) else blank_rich(c.get("read_text",""))
-            blocks = c.get("copy_blocks", [])
-            upgraded_blocks = []
-            for b in blocks:
-                upgraded_blocks.append(b if isinstance(b, dict) else blank_rich(str(b)))
-            if not upgraded_blocks:
-                upgraded_blocks = [blank_rich("")]
-
-            from models import FileContent, blank_rich
-            read_rich = c.get("read_rich") if isinstance(c.get("read_rich"), dict) else blank_rich(c.get("read_text",""))
-            blocks = c.get("copy_blocks", [])
-            upgraded_blocks = []
-            for b in blocks:
-                upgraded_blocks.append(b if isinstance(b, dict) else blank_rich(str(b)))
-            if not upgraded_blocks:
-                upgraded_blocks = [blank_rich("")]
-            node.content = FileContent(read_rich=read_rich, copy_blocks=upgraded_blocks)
-
-
-        db.nodes[newnid] = node
+            # handles both the current read_doc/copy_docs shape and legacy bundles
+            node.content = _upgrade_legacy_content(d.get("content") or {})
+
+        db.add_node(node)
+
+    # Wire parent back-pointers for the imported subtree
+    for new_nid in id_map.values():
+        n = db.nodes[new_nid]
+        if n.type == "folder":
+            for cid in n.children:
+                db.nodes[cid].parent_id = n.id
 
     # Attach imported root under target folder
     imported_root_new = id_map[bundle_root_id]
     db.nodes[target_folder_id].children.append(imported_root_new)
+    db.nodes[imported_root_new].parent_id = target_folder_id
 
     return True, "Imported."
 
@@ -2,26 +2,29 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List, Optional, Literal, Dict, Any
-import uuid
+import secrets
+import sys
 
 NodeType = Literal["folder", "file", "shortcut"]
 
 
 def new_id() -> str:
-    return str(uuid.uuid4())
+    # Same 128 bits of entropy as uuid4, without the UUID object/formatting
+    # overhead. IDs are opaque strings everywhere, so the format is free.
+    return secrets.token_hex(16)
 
 
 def blank_rich_doc() -> Dict[str, Any]:
     return {"text": "", "tags": []}
 
 
-@dataclass
+@dataclass(slots=True)
 class FileContent:
     read_doc: Dict[str, Any] = field(default_factory=blank_rich_doc)
     copy_docs: List[Dict[str, Any]] = field(default_factory=lambda: [blank_rich_doc()])
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     id: str
     type: NodeType
@@ -36,13 +39,59 @@ class Node:
     # shortcut
     target_id: Optional[str] = None  # points to a file node id
 
+    # back-pointer to the containing folder; derived from `children` on load,
+    # not persisted. Makes parent lookups O(1) instead of a full-DB scan.
+    parent_id: Optional[str] = None
 
-@dataclass
+
+@dataclass(slots=True)
 class Database:
     quickcopy_root_id: str
     favorites_root_id: str
     nodes: Dict[str, Node] = field(default_factory=dict)
 
+    # Per-type views of `nodes` (same Node objects) so traversals that only
+    # care about one kind - e.g. folder walks - can skip the rest entirely.
+    # Keep them in sync by adding/removing through add_node/remove_node.
+    folders: Dict[str, Node] = field(default_factory=dict)
+    files: Dict[str, Node] = field(default_factory=dict)
+    shortcuts: Dict[str, Node] = field(default_factory=dict)
+
+    def _by_type(self, ntype: str) -> Dict[str, Node]:
+        if ntype == "folder":
+            return self.folders
+        if ntype == "file":
+            return self.files
+        return self.shortcuts
+
+    def add_node(self, node: Node):
+        self.nodes[node.id] = node
+        self._by_type(node.type)[node.id] = node
+
+    def remove_node(self, node_id: str) -> Optional[Node]:
+        node = self.nodes.pop(node_id, None)
+        if node is not None:
+            self._by_type(node.type).pop(node_id, None)
+            node.parent_id = None
+        return node
+
+    def link_parents(self):
+        """Set every node's parent_id from the folder children lists."""
+        nodes = self.nodes
+        for folder in self.folders.values():
+            for cid in folder.children:
+                child = nodes.get(cid)
+                if child is not None:
+                    child.parent_id = folder.id
+
+    def rebuild_type_index(self):
+        """Repopulate the per-type views after bulk edits to `nodes`."""
+        self.folders.clear()
+        self.files.clear()
+        self.shortcuts.clear()
+        for node in self.nodes.values():
+            self._by_type(node.type)[node.id] = node
+
 
 def blank_database() -> Database:
     fav_root = Node(id=new_id(), type="folder", name="Favorites", children=[])
@@ -50,32 +99,48 @@ def blank_database() -> Database:
     db = Database(
         quickcopy_root_id=qc_root.id,
         favorites_root_id=fav_root.id,
-        nodes={
-            fav_root.id: fav_root,
-            qc_root.id: qc_root,
-        },
     )
+    db.add_node(fav_root)
+    db.add_node(qc_root)
     return db
 
 
+# ---- lazy tree queries (for UI code that only needs visible rows) ----
+def iter_children(db: Database, node_id: str):
+    """Yields the child Nodes of a folder, skipping dangling ids."""
+    node = db.nodes.get(node_id)
+    if not node or node.type != "folder":
+        return
+    nodes = db.nodes
+    for cid in node.children:
+        child = nodes.get(cid)
+        if child is not None:
+            yield child
+
+
 # ---- serialization helpers ----
+def _encode_node(node: Node) -> Dict[str, Any]:
+    return {
+        "id": node.id,
+        "type": node.type,
+        "name": node.name,
+        # copy: this dict is a snapshot handed to the writer thread, and the
+        # UI thread keeps mutating the live children lists while it encodes
+        "children": list(node.children),
+        "content": (
+            {"read_doc": node.content.read_doc, "copy_docs": node.content.copy_docs}
+            if node.type == "file" and node.content is not None
+            else None
+        ),
+        "target_id": node.target_id,
+    }
+
+
 def db_to_dict(db: Database) -> Dict[str, Any]:
-    out_nodes: Dict[str, Any] = {}
-    for node_id, node in db.nodes.items():
-        d = {
-            "id": node.id,
-            "type": node.type,
-            "name": node.name,
-            "children": list(node.children),
-            "content": None,
-            "target_id": node.target_id,
-        }
-        if node.type == "file" and node.content is not None:
-            d["content"] = {
-                "read_doc": node.content.read_doc,
-                "copy_docs": node.content.copy_docs,
-            }
-        out_nodes[node_id] = d
+    # Hot path for every save: the comprehension sizes the dict up front
+    # (no incremental rehashes) and _encode_node is bound once as a local.
+    encode = _encode_node
+    out_nodes: Dict[str, Any] = {node_id: encode(node) for node_id, node in db.nodes.items()}
 
     return {
         "quickcopy_root_id": db.quickcopy_root_id,
@@ -110,6 +175,22 @@ def _upgrade_legacy_content(content_raw: Any) -> FileContent:
     return FileContent(read_doc=read_doc, copy_docs=copy_docs)
 
 
+def _make_node(id: str, type: str, name: str, children: List[str],
+               content: Optional[FileContent], target_id: Optional[str]) -> Node:
+    # Hot-loop Node construction: allocate and fill the slots directly,
+    # skipping the generated __init__ (keyword handling, default factories).
+    # Keep the assignments in sync with Node's fields.
+    n = object.__new__(Node)
+    n.id = id
+    n.type = type
+    n.name = name
+    n.children = children
+    n.content = content
+    n.target_id = target_id
+    n.parent_id = None
+    return n
+
+
 def db_from_dict(data: Dict[str, Any]) -> Database:
     if not isinstance(data, dict):
         return blank_database()
@@ -123,21 +204,32 @@ def db_from_dict(data: Dict[str, Any]) -> Database:
     for node_id, d in (nodes_raw or {}).items():
         if not isinstance(d, dict):
             continue
-        ntype = d.get("type", "folder")
+        # intern the handful of repeated strings so thousands of nodes share
+        # one object per distinct value instead of one copy each
+        ntype = sys.intern(d.get("type", "folder"))
         content = None
         target_id = d.get("target_id")
 
         if ntype == "file":
-            content = _upgrade_legacy_content(d.get("content") or {})
+            c = d.get("content")
+            if isinstance(c, dict) and "read_doc" in c:
+                # fast path: content is already in the current schema, no
+                # need to run the legacy-format sniffing per file
+                content = FileContent(
+                    read_doc=c["read_doc"] or blank_rich_doc(),
+                    copy_docs=c.get("copy_docs") or [blank_rich_doc()],
+                )
+            else:
+                content = _upgrade_legacy_content(c or {})
 
         # Old app used "pinned": bool. We convert pinned files into favorites shortcuts later.
-        node = Node(
-            id=d.get("id", node_id),
-            type=ntype if ntype in ("folder", "file", "shortcut") else "folder",
-            name=d.get("name", "Untitled"),
-            children=list(d.get("children", [])),
-            content=content,
-            target_id=target_id,
+        node = _make_node(
+            d.get("id", node_id),
+            ntype if ntype in ("folder", "file", "shortcut") else "folder",
+            sys.intern(d.get("name", "Untitled")),
+            list(d.get("children", [])),
+            content,
+            target_id,
         )
         nodes[node.id] = node
 
@@ -155,6 +247,8 @@ def db_from_dict(data: Dict[str, Any]) -> Database:
             db.nodes[db.quickcopy_root_id].children.append(legacy_root_id)
         else:
             db.nodes.update(nodes)
+        db.rebuild_type_index()
+        db.link_parents()
         return db
 
     # Ensure favorites root
@@ -164,6 +258,8 @@ def db_from_dict(data: Dict[str, Any]) -> Database:
         fav_root = fav.id
 
     db = Database(quickcopy_root_id=qc_root, favorites_root_id=fav_root, nodes=nodes)
+    db.rebuild_type_index()
+    db.link_parents()
 
     # Convert any old pinned files into favorites shortcuts if "pinned" existed
     # (Safe even if pinned not present)
@@ -188,6 +284,6 @@ def _ensure_favorite_shortcut(db: Database, file_id: str):
     target = db.nodes.get(file_id)
     if not target or target.type != "file":
         return
-    sc = Node(id=new_id(), type="shortcut", name=target.name, target_id=file_id)
-    db.nodes[sc.id] = sc
+    sc = Node(id=new_id(), type="shortcut", name=target.name, target_id=file_id, parent_id=fav_root.id)
+    db.add_node(sc)
     fav_root.children.append(sc.id)
@@ -30,13 +30,15 @@ def extract_rich_doc(text: tk.Text) -> Dict[str, Any]:
         if not ranges:
             continue
 
-        # Only keep options we care about
+        # Only keep options we care about - one Tcl round-trip per option.
         cfg = {}
-        for opt in ("font", "foreground", "underline"):
-            val = text.tag_cget(tag, opt)
-            if val not in (None, "", "0"):
-                cfg[opt] = val
-        # underline can be "1" or "0"
+        font = text.tag_cget(tag, "font")
+        if font not in (None, ""):
+            cfg["font"] = font
+        fg = text.tag_cget(tag, "foreground")
+        if fg not in (None, ""):
+            cfg["foreground"] = fg
+        # underline comes back as "1" or "0"
         if text.tag_cget(tag, "underline") == "1":
             cfg["underline"] = 1
 
@@ -60,6 +62,12 @@ def apply_rich_doc(text: tk.Text, doc: Dict[str, Any]):
         if tag not in ("sel",):
             text.tag_delete(tag)
 
+    # the delete above also dropped any cached style tags - reset the memo
+    if hasattr(text, "_configured_style_tags"):
+        text._configured_style_tags.clear()
+    if hasattr(text, "_style_tag_fonts"):
+        text._style_tag_fonts.clear()
+
     tags = doc.get("tags", []) or []
     for t in tags:
         name = t.get("name")
@@ -75,28 +83,65 @@ def apply_rich_doc(text: tk.Text, doc: Dict[str, Any]):
             except Exception:
                 pass
 
-        for r in t.get("ranges", []) or []:
-            if len(r) != 2:
-                continue
+        # One Tcl call per tag: "tag add" accepts many index pairs at once,
+        # so flatten all ranges instead of calling tag_add per range.
+        flat = [idx for r in (t.get("ranges") or []) if len(r) == 2 for idx in r]
+        if flat:
             try:
-                text.tag_add(name, r[0], r[1])
+                text.tk.call(str(text), "tag", "add", name, *flat)
             except Exception:
                 pass
 
 
-def ensure_base_tags(text: tk.Text):
+def ensure_base_tags(text: tk.Text, bold_font: tkfont.Font | None = None):
     """
     Create standard tags for bold/underline and a default color tag placeholder.
     We still allow dynamic tags for any font/size/color combos.
+
+    Pass a shared bold_font when configuring many widgets: one Tcl font
+    handle serves them all instead of a fresh copy per widget.
     """
-    base_font = tkfont.nametofont(text.cget("font"))
-    bold_font = base_font.copy()
-    bold_font.configure(weight="bold")
+    if bold_font is None:
+        base_font = tkfont.nametofont(text.cget("font"))
+        bold_font = base_font.copy()
+        bold_font.configure(weight="bold")
 
     text.tag_configure("BOLD", font=bold_font)
     text.tag_configure("UNDER", underline=1)
 
 
+def _base_font(text: tk.Text) -> tkfont.Font:
+    # nametofont costs Tcl round-trips; cache the widget's base font once.
+    font = getattr(text, "_base_font_cache", None)
+    if font is None:
+        font = tkfont.nametofont(text.cget("font"))
+        text._base_font_cache = font
+    return font
+
+
+def _tag_seen(text: tk.Text, tag: str) -> bool:
+    """True if this styling tag was already configured on the widget.
+    Marks it seen otherwise, so repeat applications skip tag_configure."""
+    seen = getattr(text, "_configured_style_tags", None)
+    if seen is None:
+        seen = set()
+        text._configured_style_tags = seen
+    if tag in seen:
+        return True
+    seen.add(tag)
+    return False
+
+
+def _keep_font(text: tk.Text, tag: str, font: tkfont.Font):
+    # Hold a reference: tkfont.Font deletes its Tcl font when the Python
+    # wrapper is garbage collected.
+    fonts = getattr(text, "_style_tag_fonts", None)
+    if fonts is None:
+        fonts = {}
+        text._style_tag_fonts = fonts
+    fonts[tag] = font
+
+
 def _current_selection(text: tk.Text) -> Tuple[str, str] | None:
     try:
         start = text.index("sel.first")
@@ -128,9 +173,11 @@ def set_font_family_on_selection(text: tk.Text, family: str):
 
     # Create a tag name that is stable
     tag = f"FONT_{family}"
-    base = tkfont.nametofont(text.cget("font")).copy()
-    base.configure(family=family)
-    text.tag_configure(tag, font=base)
+    if not _tag_seen(text, tag):
+        font = _base_font(text).copy()
+        font.configure(family=family)
+        text.tag_configure(tag, font=font)
+        _keep_font(text, tag, font)
     text.tag_add(tag, start, end)
 
 
@@ -141,9 +188,11 @@ def set_font_size_on_selection(text: tk.Text, size: int):
     start, end = sel
 
     tag = f"SIZE_{size}"
-    base = tkfont.nametofont(text.cget("font")).copy()
-    base.configure(size=size)
-    text.tag_configure(tag, font=base)
+    if not _tag_seen(text, tag):
+        font = _base_font(text).copy()
+        font.configure(size=size)
+        text.tag_configure(tag, font=font)
+        _keep_font(text, tag, font)
     text.tag_add(tag, start, end)
 
 
@@ -154,7 +203,8 @@ def set_color_on_selection(text: tk.Text, color_hex: str):
     start, end = sel
 
     tag = f"COLOR_{color_hex.replace('#','')}"
-    text.tag_configure(tag, foreground=color_hex)
+    if not _tag_seen(text, tag):
+        text.tag_configure(tag, foreground=color_hex)
     text.tag_add(tag, start, end)
 
 
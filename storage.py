@@ -1,13 +1,25 @@
 # -*- coding: utf-8 -*-
 import json
+import mmap
 import os
+import queue
 import sys
+import threading
 from pathlib import Path
+from typing import Iterable, Optional, Set
 from models import Database, blank_database, db_from_dict, db_to_dict
 
+try:
+    # Much faster JSON encode/decode (Rust). Optional - stdlib json still works.
+    import orjson
+except ImportError:
+    orjson = None
+
 
 APP_NAME = "NotaryQuickCopy"
-DATA_FILENAME = "data.json"
+DATA_FILENAME = "data.json"  # legacy single-file database (pre-sharding)
+INDEX_FILENAME = "index.json"
+NODES_DIRNAME = "nodes"
 
 
 def get_app_data_dir() -> Path:
@@ -37,34 +49,195 @@ def get_app_data_dir() -> Path:
 
 
 class Storage:
+    """
+    Sharded on-disk layout so an edit only rewrites what changed:
+
+        index.json        tree structure + names (compact, no content)
+        nodes/<id>.json   one shard per file node, holding its content
+
+    Older installs had everything in data.json; that file is split into
+    shards on first load and kept around as a backup.
+    """
+
     def __init__(self, path: str | None = None):
-        
+
         #path is ignored now - kept only for compatibility.
         #Data is always stored in the proper app data directory.
-        
+
         self.app_dir = get_app_data_dir()
         self.app_dir.mkdir(parents=True, exist_ok=True)
 
         self.path = self.app_dir / DATA_FILENAME
-
+        self.index_path = self.app_dir / INDEX_FILENAME
+        self.nodes_dir = self.app_dir / NODES_DIRNAME
+
+        # Background writer: the UI thread snapshots the DB to plain dicts
+        # and queues them; the single-slot queue coalesces bursts so only
+        # the latest snapshot gets written.
+        self._q: "queue.Queue[tuple]" = queue.Queue(maxsize=1)
+        # Last failure from the writer thread; the UI thread collects it via
+        # take_write_error / flush so disk errors are never silent.
+        self._write_error: Optional[Exception] = None
+        threading.Thread(target=self._writer_loop, daemon=True).start()
+
+    # ---- low-level JSON helpers ----
+    def _read_json(self, path: Path):
+        if orjson is not None:
+            try:
+                # Map the file instead of read(): the parser consumes the
+                # page cache directly, so no full-file copy sits in RSS.
+                with open(path, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return orjson.loads(memoryview(mm))
+            except (ValueError, OSError):
+                # empty files can't be mapped (and some filesystems refuse)
+                return orjson.loads(path.read_bytes())
+        return json.loads(path.read_bytes())
+
+    def _write_json_atomic(self, path: Path, data):
+        # Serialize to one buffer up front so the file sees a single write()
+        # instead of the thousands of tiny writes json.dump(indent=2) makes.
+        if orjson is not None:
+            buf = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            buf = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(buf)
+        os.replace(tmp_path, path)
+
+    # ---- load ----
     def load_or_create_blank(self) -> Database:
-        if not self.path.exists():
-            db = blank_database()
+        if self.index_path.exists():
+            return self.load()
+
+        if self.path.exists():
+            # One-time migration: split legacy data.json into index + shards.
+            db = db_from_dict(self._read_json(self.path))
             self.save(db)
             return db
-        return self.load()
 
-    def load(self) -> Database:
-        with open(self.path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return db_from_dict(data)
+        db = blank_database()
+        self.save(db)
+        return db
 
+    def load(self) -> Database:
+        index = self._read_json(self.index_path)
+        nodes_raw = index.get("nodes") or {}
+        for nid, d in nodes_raw.items():
+            if isinstance(d, dict) and d.get("type") == "file":
+                try:
+                    d["content"] = self._read_json(self.nodes_dir / f"{nid}.json")
+                except Exception:
+                    # missing/corrupt shard -> file opens blank instead of failing
+                    d["content"] = None
+        return db_from_dict(index)
+
+    # ---- save ----
     def save(self, db: Database):
-        data = db_to_dict(db)
-
-        tmp_path = self.path.with_suffix(".tmp")
-
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-        os.replace(tmp_path, self.path)
\ No newline at end of file
+        """Synchronous full rewrite: index + every file shard."""
+        self._write_snapshot(db_to_dict(db), None)
+
+    def save_async(self, db: Database, dirty_ids: Optional[Iterable[str]] = None):
+        """
+        Queue a save for the writer thread. Snapshotting (db_to_dict) happens
+        here on the caller's thread; the disk work happens off the UI thread.
+        With dirty_ids, only those shards are rewritten (plus the compact
+        index) - O(changed nodes), not O(whole DB). If a save is already
+        pending it is replaced, merging its dirty set so the coalesced write
+        still covers everything.
+        """
+        item = (db_to_dict(db), None if dirty_ids is None else set(dirty_ids))
+        while True:
+            try:
+                self._q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    old = self._q.get_nowait()
+                    if old[1] is None or item[1] is None:
+                        item = (item[0], None)
+                    else:
+                        item = (item[0], item[1] | old[1])
+                    self._q.task_done()
+                except queue.Empty:
+                    pass
+
+    def take_write_error(self) -> Optional[Exception]:
+        """Return and clear the last background write failure, if any."""
+        err, self._write_error = self._write_error, None
+        return err
+
+    def flush(self):
+        """Block until every queued save has hit the disk. Raises the last
+        background write failure, if one is pending."""
+        self._q.join()
+        err = self.take_write_error()
+        if err is not None:
+            raise err
+
+    def _writer_loop(self):
+        while True:
+            data, dirty_ids = self._q.get()
+            try:
+                self._write_snapshot(data, dirty_ids)
+            except Exception as e:
+                # the failed snapshot is gone - stash the error so the UI
+                # thread can tell the user instead of losing edits silently
+                self._write_error = e
+            finally:
+                self._q.task_done()
+
+    def _write_snapshot(self, data, dirty_ids: Optional[Set[str]]):
+        nodes = data["nodes"]
+        self.nodes_dir.mkdir(parents=True, exist_ok=True)
+
+        if dirty_ids is None:
+            # full rewrite, dropping stale shards
+            keep = set()
+            for nid, d in nodes.items():
+                if d["type"] == "file":
+                    keep.add(f"{nid}.json")
+                    self._write_json_atomic(self.nodes_dir / f"{nid}.json", d["content"] or {})
+            self._write_index(data)
+            try:
+                for p in self.nodes_dir.iterdir():
+                    if p.suffix == ".json" and p.name not in keep:
+                        p.unlink()
+            except OSError:
+                pass
+            return
+
+        for nid in dirty_ids:
+            d = nodes.get(nid)
+            if d is None:
+                # node was deleted - drop its shard if it had one
+                try:
+                    (self.nodes_dir / f"{nid}.json").unlink()
+                except OSError:
+                    pass
+            elif d["type"] == "file":
+                self._write_json_atomic(self.nodes_dir / f"{nid}.json", d["content"] or {})
+        self._write_index(data)
+
+    def _write_index(self, data):
+        # Structure + names only; content lives in the shards.
+        index_nodes = {
+            nid: {
+                "id": d["id"],
+                "type": d["type"],
+                "name": d["name"],
+                "children": d["children"],
+                "target_id": d["target_id"],
+            }
+            for nid, d in data["nodes"].items()
+        }
+        self._write_json_atomic(
+            self.index_path,
+            {
+                "quickcopy_root_id": data["quickcopy_root_id"],
+                "favorites_root_id": data["favorites_root_id"],
+                "nodes": index_nodes,
+            },
+        )
@@ -1,12 +1,31 @@
 ﻿# -*- coding: utf-8 -*-
 from __future__ import annotations
+import bisect
 import json
+import os
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-from models import Database, Node, FileContent, new_id, blank_rich_doc, db_from_dict, db_to_dict
+from models import (
+    Database,
+    Node,
+    FileContent,
+    new_id,
+    blank_rich_doc,
+    db_from_dict,
+    db_to_dict,
+    iter_children,
+)
 from dialogs import ask_text, ask_save_json, ask_open_json
-from utils import safe_name
+from utils import safe_name, register_scrollable
+
+try:
+    # Much faster JSON encode/decode (Rust). Optional - stdlib json still works.
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class ExplorerView(ttk.Frame):
@@ -21,6 +40,25 @@ class ExplorerView(ttk.Frame):
         self.current_folder_id = db.quickcopy_root_id
         self.search_var = tk.StringVar(value="")
 
+        # Virtualized right list: the full (sorted) result lives here and
+        # only the rows inside the viewport are inserted into the Treeview.
+        self._list_model: list[Node] = []
+        self._viewport_start = 0
+        self._search_after_id = None
+
+        # Search index: lowered name per node id, plus a trigram -> node ids
+        # map so queries touch candidates instead of the whole DB.
+        self._lower_names: dict[str, str] = {}
+        self._name_index: dict[str, set[str]] = {}
+
+        # file id -> shortcut id for everything under the Favorites root, so
+        # rendering a row costs a dict probe instead of scanning favorites
+        self._fav_by_target: dict[str, str] = {}
+
+        # node id -> (text, type label, fav glyph), so scrolling re-renders
+        # rows from one dict probe; dropped on rename/favorite changes
+        self._row_cache: dict[str, tuple[str, str, str]] = {}
+
         self._build_ui()
         self._bind_hotkeys()
 
@@ -56,8 +94,10 @@ class ExplorerView(ttk.Frame):
         # Group 4: Transfer
         grp_transfer = ttk.LabelFrame(bar, text="Transfer", padding=(8, 6))
         grp_transfer.pack(side="left")
-        ttk.Button(grp_transfer, text="Export", command=self.export_bundle).pack(side="left")
-        ttk.Button(grp_transfer, text="Import", command=self.import_bundle).pack(side="left", padx=(8, 0))
+        self.btn_export = ttk.Button(grp_transfer, text="Export", command=self.export_bundle)
+        self.btn_export.pack(side="left")
+        self.btn_import = ttk.Button(grp_transfer, text="Import", command=self.import_bundle)
+        self.btn_import.pack(side="left", padx=(8, 0))
 
         # Group 5: Search (right aligned)
         grp_search = ttk.LabelFrame(bar, text="Search", padding=(8, 6))
@@ -66,7 +106,7 @@ class ExplorerView(ttk.Frame):
         self.search_entry.pack(side="left", padx=(0, 8))
         ttk.Button(grp_search, text="Clear", command=self.clear_search).pack(side="left")
 
-        self.search_entry.bind("<KeyRelease>", lambda e: self.refresh_right_list())
+        self.search_entry.bind("<KeyRelease>", self._schedule_search)
         self.search_entry.bind("<Escape>", lambda e: self.clear_search())
 
         panes = ttk.Panedwindow(self, orient="horizontal")
@@ -80,12 +120,15 @@ class ExplorerView(ttk.Frame):
 
         self.folder_tree = ttk.Treeview(left, show="tree")
         self.folder_tree.pack(fill="both", expand=True, side="left")
+        register_scrollable(self.folder_tree)
 
         ysb_l = ttk.Scrollbar(left, orient="vertical", command=self.folder_tree.yview)
         ysb_l.pack(side="right", fill="y")
         self.folder_tree.configure(yscrollcommand=ysb_l.set)
 
         self.folder_tree.bind("<<TreeviewSelect>>", self._on_folder_select)
+        # folders materialize their subfolders on first expand
+        self.folder_tree.bind("<<TreeviewOpen>>", self._on_folder_open)
 
         # Right: contents list (Name + Type + ★)
         right = ttk.Frame(panes)
@@ -114,9 +157,15 @@ class ExplorerView(ttk.Frame):
         self.list_tree.column("fav", width=90, anchor="center")
         self.list_tree.pack(fill="both", expand=True, side="left")
 
-        ysb_r = ttk.Scrollbar(right, orient="vertical", command=self.list_tree.yview)
-        ysb_r.pack(side="right", fill="y")
-        self.list_tree.configure(yscrollcommand=ysb_r.set)
+        # The scrollbar drives the virtual window, not the Treeview itself:
+        # the widget only ever holds one viewport's worth of rows.
+        self.list_ysb = ttk.Scrollbar(right, orient="vertical", command=self._on_list_scroll)
+        self.list_ysb.pack(side="right", fill="y")
+
+        self.list_tree.bind("<MouseWheel>", self._on_list_wheel)
+        self.list_tree.bind("<Button-4>", lambda e: self._on_list_wheel_linux(-3))
+        self.list_tree.bind("<Button-5>", lambda e: self._on_list_wheel_linux(3))
+        self.list_tree.bind("<Configure>", lambda e: self._render_viewport())
 
         self.list_tree.bind("<Double-1>", lambda e: self.open_selected())
         self.list_tree.bind("<Return>", lambda e: self.open_selected())
@@ -134,10 +183,36 @@ class ExplorerView(ttk.Frame):
         self.refresh_all()
 
     def _bind_hotkeys(self):
-        self.bind_all("<Control-f>", lambda e: self._focus_search())
-        self.bind_all("<Delete>", lambda e: self.delete_selected())
-        self.bind_all("<Return>", lambda e: self.open_selected())
-        self.bind_all("<Escape>", lambda e: self._global_escape())
+        # Delete/Return act on a selection, so bind them on the trees that
+        # own one instead of process-wide - bind_all dispatched every
+        # keystroke app-wide, including while typing in the file view.
+        self.folder_tree.bind("<Delete>", lambda e: self.delete_selected())
+        self.list_tree.bind("<Delete>", lambda e: self.delete_selected())
+        self.folder_tree.bind("<Return>", lambda e: self.open_selected())
+        # (list_tree already binds <Return> to open_selected in _build_ui)
+
+        # Ctrl+F / Escape should work anywhere in the window; the toplevel
+        # sits in every descendant's bindtags, so this stays window-scoped.
+        top = self.winfo_toplevel()
+        self._hotkey_funcids = [
+            ("<Control-f>", top.bind("<Control-f>", lambda e: self._focus_search(), add="+")),
+            ("<Escape>", top.bind("<Escape>", lambda e: self._global_escape(), add="+")),
+        ]
+        self.bind("<Destroy>", self._unbind_hotkeys, add="+")
+
+    def _unbind_hotkeys(self, event=None):
+        if event is not None and event.widget is not self:
+            return
+        try:
+            top = self.winfo_toplevel()
+        except Exception:
+            return
+        for seq, funcid in getattr(self, "_hotkey_funcids", []):
+            try:
+                top.unbind(seq, funcid)
+            except Exception:
+                pass
+        self._hotkey_funcids = []
 
     def _global_escape(self):
         if (self.search_var.get() or "").strip():
@@ -151,6 +226,71 @@ class ExplorerView(ttk.Frame):
             pass
 
     # ---------- Search helpers ----------
+    def _schedule_search(self, _evt=None):
+        # Debounce: one refresh ~250ms after the last keystroke instead of a
+        # full DB scan + list rebuild per character typed.
+        if self._search_after_id is not None:
+            try:
+                self.after_cancel(self._search_after_id)
+            except Exception:
+                pass
+        self._search_after_id = self.after(250, self._do_search)
+
+    def _do_search(self):
+        self._search_after_id = None
+        self.refresh_right_list()
+
+    def _sort_key(self, n: Node):
+        # list.sort calls the key once per element, so the win here is not
+        # recomputing .lower() - reuse the lowered name the index already has
+        low = self._lower_names.get(n.id)
+        if low is None:
+            low = (n.name or "").lower()
+        return (0 if n.type == "folder" else 1, low)
+
+    def _index_add(self, node: Node):
+        low = (node.name or "").lower()
+        self._lower_names[node.id] = low
+        for i in range(len(low) - 2):
+            self._name_index.setdefault(low[i:i + 3], set()).add(node.id)
+
+    def _index_remove(self, node_id: str):
+        low = self._lower_names.pop(node_id, "")
+        for i in range(len(low) - 2):
+            ids = self._name_index.get(low[i:i + 3])
+            if ids:
+                ids.discard(node_id)
+
+    def _rebuild_name_index(self):
+        lower = {}
+        index: dict[str, set[str]] = {}
+        for nid, n in self.db.nodes.items():
+            low = (n.name or "").lower()
+            lower[nid] = low
+            for i in range(len(low) - 2):
+                index.setdefault(low[i:i + 3], set()).add(nid)
+        self._lower_names = lower
+        self._name_index = index
+
+    def _search_ids(self, query: str) -> list[str]:
+        """Node ids whose lowered name contains `query`, via the trigram
+        index when the query is long enough to have trigrams."""
+        lower = self._lower_names
+        if len(query) < 3:
+            return [nid for nid, low in lower.items() if query in low]
+
+        index = self._name_index
+        candidates: set[str] | None = None
+        for i in range(len(query) - 2):
+            ids = index.get(query[i:i + 3])
+            if not ids:
+                return []
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+        # trigram hits can be false positives across gaps - verify for real
+        return [nid for nid in candidates if query in lower.get(nid, "")]
+
     def clear_search(self):
         if self.search_var.get() != "":
             self.search_var.set("")
@@ -159,16 +299,20 @@ class ExplorerView(ttk.Frame):
 
     # ---------- Navigation ----------
     def go_favorites(self):
-        self.clear_search()
-        self.current_folder_id = self.db.favorites_root_id
-        self.refresh_right_list()
-        self._select_folder_in_tree(self.current_folder_id)
+        self._go_folder(self.db.favorites_root_id)
 
     def go_quickcopy(self):
-        self.clear_search()
-        self.current_folder_id = self.db.quickcopy_root_id
+        self._go_folder(self.db.quickcopy_root_id)
+
+    def _go_folder(self, folder_id: str):
+        searching = bool((self.search_var.get() or "").strip())
+        if folder_id == self.current_folder_id and not searching:
+            return  # already showing this folder - nothing to rebuild
+        if searching:
+            self.search_var.set("")
+        self.current_folder_id = folder_id
         self.refresh_right_list()
-        self._select_folder_in_tree(self.current_folder_id)
+        self._select_folder_in_tree(folder_id)
 
     def _select_folder_in_tree(self, folder_id: str):
         try:
@@ -180,17 +324,20 @@ class ExplorerView(ttk.Frame):
     def _capture_return_state(self) -> dict:
         sel_folder = self.folder_tree.selection()
         sel_list = self.list_tree.selection()
-        y0, y1 = self.list_tree.yview()
+        total = len(self._list_model)
         return {
             "folder_id": sel_folder[0] if sel_folder else self.current_folder_id,
             "selected_id": sel_list[0] if sel_list else None,
-            "yview": y0,
+            "yview": (self._viewport_start / total) if total else 0.0,
             "search": "",
         }
 
     # ---------- Refresh ----------
     def refresh_all(self, return_state: dict | None = None):
         self.search_var.set("")
+        self._rebuild_name_index()
+        self._rebuild_fav_index()
+        self._row_cache.clear()
 
         if return_state:
             fid = return_state.get("folder_id")
@@ -201,18 +348,19 @@ class ExplorerView(ttk.Frame):
         self.refresh_right_list()
 
         if return_state:
+            yview = return_state.get("yview")
+            if yview is not None:
+                try:
+                    self._scroll_list_to(int(float(yview) * len(self._list_model)))
+                except Exception:
+                    pass
             sel_id = return_state.get("selected_id")
             if sel_id and sel_id in self.db.nodes:
                 try:
                     self.list_tree.selection_set(sel_id)
                     self.list_tree.see(sel_id)
                 except Exception:
-                    pass
-            yview = return_state.get("yview")
-            if yview is not None:
-                try:
-                    self.list_tree.yview_moveto(float(yview))
-                except Exception:
+                    # the row may be outside the rendered viewport
                     pass
 
     def refresh_folder_tree(self):
@@ -222,78 +370,195 @@ class ExplorerView(ttk.Frame):
         qc = self.db.nodes.get(self.db.quickcopy_root_id)
         if fav:
             self._insert_folder("", fav, prefix="⭐ ")
+            self._materialize_folder_children(fav.id)
             self.folder_tree.item(fav.id, open=True)
         if qc:
             self._insert_folder("", qc, prefix="📁 ")
+            self._materialize_folder_children(qc.id)
             self.folder_tree.item(qc.id, open=True)
 
         self._select_folder_in_tree(self.current_folder_id)
 
     def _insert_folder(self, parent_iid: str, node: Node, prefix: str = "📁 "):
+        """Insert one folder row. Subfolders are represented by a stub child
+        until the row is actually expanded - opening a huge tree stays O(visible)."""
         if node.type != "folder":
             return
         self.folder_tree.insert(parent_iid, "end", iid=node.id, text=prefix + node.name, open=False)
 
+        if any(cid in self.db.folders for cid in node.children):
+            self.folder_tree.insert(node.id, "end", iid=self._stub_iid(node.id), text="…")
+
+    @staticmethod
+    def _stub_iid(folder_id: str) -> str:
+        return folder_id + "::stub"
+
+    def _on_folder_open(self, _evt):
+        iid = self.folder_tree.focus()
+        if iid:
+            self._materialize_folder_children(iid)
+
+    def _materialize_folder_children(self, folder_id: str):
+        stub = self._stub_iid(folder_id)
+        if not self.folder_tree.exists(stub):
+            return  # already materialized (or leaf)
+        self.folder_tree.delete(stub)
+        node = self.db.folders.get(folder_id)
+        if node is None:
+            return
         for cid in node.children:
-            child = self.db.nodes.get(cid)
-            if child and child.type == "folder":
-                self._insert_folder(node.id, child, prefix="📁 ")
+            child = self.db.folders.get(cid)
+            if child is not None and not self.folder_tree.exists(cid):
+                self._insert_folder(folder_id, child)
 
     def _on_folder_select(self, _evt):
         sel = self.folder_tree.selection()
         if not sel:
             return
-
-        if (self.search_var.get() or "").strip():
-            self.search_var.set("")
-
-        self.current_folder_id = sel[0]
-        self.refresh_right_list()
+        self._go_folder(sel[0])
 
     def refresh_right_list(self):
-        self.list_tree.delete(*self.list_tree.get_children())
-
         query = (self.search_var.get() or "").strip().lower()
 
         if query:
             self.right_title.config(text=f"Search results: '{query}'")
-            matches = []
-            for n in self.db.nodes.values():
-                if query in (n.name or "").lower():
-                    if n.type in ("folder", "file", "shortcut"):
-                        matches.append(n)
+            if len(query) < 3:
+                # too short for the trigram index - a DB-wide scan per
+                # keystroke isn't worth it, so narrow the current folder
+                lower = self._lower_names
+                items = [
+                    n for n in iter_children(self.db, self.current_folder_id)
+                    if (lower.get(n.id) or (n.name or "").lower()).startswith(query)
+                ]
+            else:
+                items = [self.db.nodes[nid] for nid in self._search_ids(query) if nid in self.db.nodes]
+            items.sort(key=self._sort_key)
+        else:
+            folder = self.db.nodes.get(self.current_folder_id)
+            self.right_title.config(text=f"Contents: {folder.name if folder else ''}")
 
-            matches.sort(key=lambda n: (0 if n.type == "folder" else 1, (n.name or "").lower()))
-            for n in matches:
-                self._insert_right_row(n)
-            return
+            if not folder or folder.type != "folder":
+                items = []
+            else:
+                items = list(iter_children(self.db, folder.id))
+                items.sort(key=self._sort_key)
 
-        folder = self.db.nodes.get(self.current_folder_id)
-        self.right_title.config(text=f"Contents: {folder.name if folder else ''}")
+        self._list_model = items
+        self._viewport_start = 0
+        self._render_viewport()
 
-        if not folder or folder.type != "folder":
-            return
+    # ---------- Virtual viewport ----------
+    # Treeview insert cost is per-row, so a 10k-item folder would pay for
+    # 10k rows on every refresh. Instead only the ~visible slice is ever
+    # inserted and the scrollbar/wheel move the slice over _list_model.
+    _ROW_PX = 20  # rough row height; only used to size the slice generously
 
-        items = [self.db.nodes[cid] for cid in folder.children if cid in self.db.nodes]
-        items.sort(key=lambda n: (0 if n.type == "folder" else 1, (n.name or "").lower()))
-        for n in items:
-            self._insert_right_row(n)
+    def _viewport_rows(self) -> int:
+        try:
+            return max(10, self.list_tree.winfo_height() // self._ROW_PX)
+        except Exception:
+            return 25
 
-    def _insert_right_row(self, node: Node):
-        if node.type == "folder":
-            name = "📁 " + node.name
-            t = "Folder"
-            fav = ""
-        elif node.type == "file":
-            name = "📄 " + node.name
-            t = "File"
-            fav = self.star_text if self.is_favorited(node.id) else ""
+    def _render_viewport(self):
+        total = len(self._list_model)
+        rows = self._viewport_rows()
+        start = max(0, min(self._viewport_start, total - rows))
+        self._viewport_start = start
+
+        self.list_tree.delete(*self.list_tree.get_children())
+
+        # one tight loop with hoisted locals: attribute lookups and the
+        # favorite probe happen once per row, nothing else
+        insert = self.list_tree.insert
+        is_fav = self.is_favorited
+        star = self.star_text
+        cache = self._row_cache
+        for n in self._list_model[start:start + rows]:
+            row = cache.get(n.id)
+            if row is None:
+                if n.type == "folder":
+                    row = ("📁 " + n.name, "Folder", "")
+                elif n.type == "file":
+                    row = ("📄 " + n.name, "File", star if is_fav(n.id) else "")
+                else:
+                    row = ("🔗 " + n.name, "Favorite Shortcut", star)
+                cache[n.id] = row
+            insert("", "end", iid=n.id, text=row[0], values=(row[1], row[2]))
+
+        if total:
+            self.list_ysb.set(start / total, min(1.0, (start + rows) / total))
         else:
-            name = "🔗 " + node.name
-            t = "Favorite Shortcut"
-            fav = self.star_text
+            self.list_ysb.set(0.0, 1.0)
+
+    def _scroll_list_to(self, start: int):
+        total = len(self._list_model)
+        start = max(0, min(start, total - self._viewport_rows()))
+        if start != self._viewport_start:
+            self._viewport_start = start
+            self._render_viewport()
+
+    def _on_list_scroll(self, *args):
+        # scrollbar protocol: ("moveto", frac) or ("scroll", n, "units"/"pages")
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._scroll_list_to(int(float(args[1]) * len(self._list_model)))
+        elif args[0] == "scroll":
+            n = int(args[1])
+            step = self._viewport_rows() if args[2] == "pages" else 1
+            self._scroll_list_to(self._viewport_start + n * step)
+
+    def _on_list_wheel(self, event):
+        self._scroll_list_to(self._viewport_start + (-3 if event.delta > 0 else 3))
+        return "break"
+
+    def _on_list_wheel_linux(self, units: int):
+        self._scroll_list_to(self._viewport_start + units)
+        return "break"
+
+    # ---------- Incremental updates ----------
+    # Single-node mutations patch the affected rows (and the search index)
+    # instead of rebuilding both trees; refresh_all stays for load/import.
+    def insert_one(self, node: Node):
+        self._index_add(node)
+
+        if node.type == "folder" and node.parent_id and self.folder_tree.exists(node.parent_id):
+            if self.folder_tree.exists(self._stub_iid(node.parent_id)):
+                pass  # parent not expanded yet; the stub already marks it
+            else:
+                self._insert_folder(node.parent_id, node)
+
+        if not (self.search_var.get() or "").strip() and node.parent_id == self.current_folder_id:
+            bisect.insort(self._list_model, node, key=self._sort_key)
+            self._render_viewport()
+
+    def remove_one(self, node_id: str):
+        self._index_remove(node_id)
+        self._row_cache.pop(node_id, None)
+        if self.folder_tree.exists(node_id):
+            self.folder_tree.delete(node_id)
+        for i, n in enumerate(self._list_model):
+            if n.id == node_id:
+                del self._list_model[i]
+                self._render_viewport()
+                break
+
+    def refresh_one(self, node_id: str):
+        node = self.db.nodes.get(node_id)
+        if node is None:
+            return
+        self._index_remove(node_id)
+        self._index_add(node)
+        self._row_cache.pop(node_id, None)
+
+        if self.folder_tree.exists(node_id):
+            prefix = "⭐ " if node_id == self.db.favorites_root_id else "📁 "
+            self.folder_tree.item(node_id, text=prefix + node.name)
 
-        self.list_tree.insert("", "end", iid=node.id, text=name, values=(t, fav))
+        if any(n.id == node_id for n in self._list_model):
+            # the rename may move the row, so re-sort (O(folder), not O(DB))
+            self._list_model.sort(key=self._sort_key)
+            self._render_viewport()
 
     # ---------- Selection helpers ----------
     def _right_selected_node_id(self) -> str | None:
@@ -318,15 +583,14 @@ class ExplorerView(ttk.Frame):
         if not node:
             return
 
-        if (self.search_var.get() or "").strip():
-            self.search_var.set("")
-
         if node.type == "folder":
-            self.current_folder_id = node.id
-            self.refresh_right_list()
-            self._select_folder_in_tree(node.id)
+            # _go_folder clears any active search itself
+            self._go_folder(node.id)
             return
 
+        if (self.search_var.get() or "").strip():
+            self.search_var.set("")
+
         if node.type == "shortcut":
             target = self.db.nodes.get(node.target_id) if node.target_id else None
             if not target or target.type != "file":
@@ -341,15 +605,18 @@ class ExplorerView(ttk.Frame):
             self.on_open_file(node.id, return_state=state)
 
     # ---------- Favorites logic (shortcuts) ----------
-    def is_favorited(self, file_id: str) -> bool:
+    def _rebuild_fav_index(self):
+        self._fav_by_target = {}
         fav_root = self.db.nodes.get(self.db.favorites_root_id)
         if not fav_root or fav_root.type != "folder":
-            return False
+            return
         for cid in fav_root.children:
             n = self.db.nodes.get(cid)
-            if n and n.type == "shortcut" and n.target_id == file_id:
-                return True
-        return False
+            if n and n.type == "shortcut" and n.target_id:
+                self._fav_by_target[n.target_id] = n.id
+
+    def is_favorited(self, file_id: str) -> bool:
+        return file_id in self._fav_by_target
 
     def toggle_favorite_selected(self):
         node = self._get_selected_node_anywhere()
@@ -388,9 +655,11 @@ class ExplorerView(ttk.Frame):
             if n and n.type == "shortcut" and n.target_id == file_id:
                 return
 
-        sc = Node(id=new_id(), type="shortcut", name=target.name, target_id=file_id)
-        self.db.nodes[sc.id] = sc
+        sc = Node(id=new_id(), type="shortcut", name=target.name, target_id=file_id, parent_id=fav_root.id)
+        self.db.add_node(sc)
         fav_root.children.append(sc.id)
+        self._fav_by_target[file_id] = sc.id
+        self._row_cache.pop(file_id, None)  # fav glyph changed
 
     def _remove_shortcut_for_target(self, file_id: str):
         fav_root = self.db.nodes.get(self.db.favorites_root_id)
@@ -400,14 +669,20 @@ class ExplorerView(ttk.Frame):
             n = self.db.nodes.get(cid)
             if n and n.type == "shortcut" and n.target_id == file_id:
                 fav_root.children.remove(cid)
-                self.db.nodes.pop(cid, None)
+                self.db.remove_node(cid)
+                self._fav_by_target.pop(file_id, None)
+                self._row_cache.pop(file_id, None)  # fav glyph changed
                 return
 
     def _remove_shortcut(self, shortcut_id: str):
         fav_root = self.db.nodes.get(self.db.favorites_root_id)
         if fav_root and fav_root.type == "folder":
             fav_root.children = [c for c in fav_root.children if c != shortcut_id]
-        self.db.nodes.pop(shortcut_id, None)
+        sc = self.db.remove_node(shortcut_id)
+        if sc is not None and sc.target_id:
+            self._fav_by_target.pop(sc.target_id, None)
+            self._row_cache.pop(sc.target_id, None)  # fav glyph changed
+        self._row_cache.pop(shortcut_id, None)
 
     # ---------- Create / Rename / Delete ----------
     def create_folder(self):
@@ -420,12 +695,12 @@ class ExplorerView(ttk.Frame):
             return
         name = safe_name(name)
 
-        new_node = Node(id=new_id(), type="folder", name=name, children=[])
-        self.db.nodes[new_node.id] = new_node
+        new_node = Node(id=new_id(), type="folder", name=name, children=[], parent_id=parent.id)
+        self.db.add_node(new_node)
         parent.children.append(new_node.id)
 
         self.on_db_changed()
-        self.refresh_all()
+        self.insert_one(new_node)
 
     def create_file(self):
         parent = self.db.nodes.get(self.current_folder_id) or self.db.nodes.get(self.db.quickcopy_root_id)
@@ -442,12 +717,13 @@ class ExplorerView(ttk.Frame):
             type="file",
             name=name,
             content=FileContent(read_doc=blank_rich_doc(), copy_docs=[blank_rich_doc()]),
+            parent_id=parent.id,
         )
-        self.db.nodes[new_node.id] = new_node
+        self.db.add_node(new_node)
         parent.children.append(new_node.id)
 
         self.on_db_changed()
-        self.refresh_all()
+        self.insert_one(new_node)
 
     def rename_selected(self):
         node = self._get_selected_node_anywhere()
@@ -466,6 +742,8 @@ class ExplorerView(ttk.Frame):
             return
         node.name = safe_name(new_name)
 
+        self.refresh_one(node.id)
+
         if node.type == "file":
             fav_root = self.db.nodes.get(self.db.favorites_root_id)
             if fav_root and fav_root.type == "folder":
@@ -473,9 +751,9 @@ class ExplorerView(ttk.Frame):
                     sc = self.db.nodes.get(cid)
                     if sc and sc.type == "shortcut" and sc.target_id == node.id:
                         sc.name = node.name
+                        self.refresh_one(sc.id)
 
         self.on_db_changed()
-        self.refresh_all()
 
     def delete_selected(self):
         node = self._get_selected_node_anywhere()
@@ -504,31 +782,54 @@ class ExplorerView(ttk.Frame):
         if node.type == "file":
             self._remove_shortcut_for_target(node.id)
 
-        if node.type == "folder" and node.id == self.current_folder_id:
+        was_current = node.type == "folder" and node.id == self.current_folder_id
+        if was_current:
             if parent and parent.type == "folder":
                 self.current_folder_id = parent.id
             else:
                 self.current_folder_id = self.db.quickcopy_root_id
 
-        self._delete_subtree(node.id)
+        removed = self._delete_subtree(node.id)
+        for rid in removed:
+            self._index_remove(rid)
+            self._row_cache.pop(rid, None)
 
         self.on_db_changed()
-        self.refresh_all()
+        self.remove_one(node.id)
+        # an active search can also list descendants of the subtree; drop
+        # them from the model too or they linger as dead rows
+        removed_ids = set(removed)
+        survivors = [n for n in self._list_model if n.id not in removed_ids]
+        if len(survivors) != len(self._list_model):
+            self._list_model = survivors
+            self._render_viewport()
+        if was_current:
+            self.refresh_right_list()
+            self._select_folder_in_tree(self.current_folder_id)
 
     def _find_parent_folder(self, child_id: str) -> Node | None:
-        for n in self.db.nodes.values():
-            if n.type == "folder" and child_id in n.children:
-                return n
-        return None
-
-    def _delete_subtree(self, node_id: str):
-        node = self.db.nodes.get(node_id)
-        if not node:
-            return
-        if node.type == "folder":
-            for cid in list(node.children):
-                self._delete_subtree(cid)
-        self.db.nodes.pop(node_id, None)
+        # parent_id back-pointer makes this O(1) instead of a full-DB scan
+        node = self.db.nodes.get(child_id)
+        if node is None or not node.parent_id:
+            return None
+        parent = self.db.nodes.get(node.parent_id)
+        return parent if parent is not None and parent.type == "folder" else None
+
+    def _delete_subtree(self, node_id: str) -> list[str]:
+        # Iterative: one Python frame regardless of depth, so a pathological
+        # import can't hit the recursion limit. Returns the removed ids.
+        removed: list[str] = []
+        stack = [node_id]
+        remove = self.db.remove_node
+        while stack:
+            nid = stack.pop()
+            node = remove(nid)
+            if node is None:
+                continue
+            removed.append(nid)
+            if node.type == "folder":
+                stack.extend(node.children)
+        return removed
 
     # ---------- Right-click menu ----------
     def _on_right_click(self, event):
@@ -548,48 +849,116 @@ class ExplorerView(ttk.Frame):
                 pass
 
     # ---------- Export / Import ----------
+    # Serialization runs on a worker thread so a large DB doesn't freeze the
+    # window; the UI thread snapshots/merges and polls for completion. The
+    # Transfer buttons are disabled meanwhile to keep the DB unmutated.
+    def _set_transfer_enabled(self, enabled: bool):
+        state = "normal" if enabled else "disabled"
+        self.btn_export.configure(state=state)
+        self.btn_import.configure(state=state)
+
     def export_bundle(self):
         path = ask_save_json(self, default_name="notary_quickcopy_bundle.json")
         if not path:
             return
-        data = db_to_dict(self.db)
+        data = db_to_dict(self.db)  # snapshot while still on the UI thread
+        self._set_transfer_enabled(False)
+        done: "queue.Queue" = queue.Queue(maxsize=1)
+        threading.Thread(target=self._export_worker, args=(path, data, done), daemon=True).start()
+        self.after(50, self._poll_export_done, done)
+
+    @staticmethod
+    def _export_worker(path: str, data: dict, done: "queue.Queue"):
+        # Write to a sibling tempfile and swap it in, so a crash mid-write
+        # can never leave a truncated bundle at the chosen path.
+        tmp = path + ".tmp"
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(tmp, "wb", buffering=1 << 20) as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                # stream encoder chunks instead of building one big string
+                encoder = json.JSONEncoder(indent=2, ensure_ascii=False, check_circular=False)
+                with open(tmp, "w", encoding="utf-8", buffering=1 << 20) as f:
+                    f.writelines(encoder.iterencode(data))
+            os.replace(tmp, path)
+            done.put(None)
         except Exception as e:
-            messagebox.showerror("Export failed", str(e))
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            done.put(e)
+
+    def _poll_export_done(self, done: "queue.Queue"):
+        try:
+            err = done.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_export_done, done)
+            return
+        self._set_transfer_enabled(True)
+        if err is not None:
+            messagebox.showerror("Export failed", str(err))
 
     def import_bundle(self):
         path = ask_open_json(self)
         if not path:
             return
+        self._set_transfer_enabled(False)
+        done: "queue.Queue" = queue.Queue(maxsize=1)
+        threading.Thread(target=self._import_worker, args=(path, done), daemon=True).start()
+        self.after(50, self._poll_import_done, done)
+
+    @staticmethod
+    def _import_worker(path: str, done: "queue.Queue"):
         try:
             with open(path, "r", encoding="utf-8") as f:
                 raw = json.load(f)
-            incoming = db_from_dict(raw)
+            # db_from_dict is pure - safe off-thread; the merge into the
+            # live DB happens back on the UI thread
+            done.put(db_from_dict(raw))
         except Exception as e:
-            messagebox.showerror("Import failed", f"Could not read bundle:\n\n{e}")
+            done.put(e)
+
+    def _poll_import_done(self, done: "queue.Queue"):
+        try:
+            result = done.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_import_done, done)
+            return
+        self._set_transfer_enabled(True)
+        if isinstance(result, Exception):
+            messagebox.showerror("Import failed", f"Could not read bundle:\n\n{result}")
             return
+        self._merge_imported(result)
+
+    def _merge_imported(self, incoming: Database):
+        # Hoist the hot names once; the loops below touch them per node.
+        nodes = self.db.nodes
+        add = self.db.add_node
+        make_id = new_id
+        incoming_items = list(incoming.nodes.items())
 
-        id_map = {}
-        for old_id in incoming.nodes.keys():
-            id_map[old_id] = (new_id() if old_id in self.db.nodes else old_id)
+        id_map = {old_id: (make_id() if old_id in nodes else old_id) for old_id, _ in incoming_items}
 
-        for old_id, node in incoming.nodes.items():
-            newnode = Node(
+        for old_id, node in incoming_items:
+            add(Node(
                 id=id_map[old_id],
                 type=node.type,
                 name=node.name,
                 children=[],
                 content=node.content,
                 target_id=(id_map.get(node.target_id) if node.type == "shortcut" else node.target_id),
-            )
-            self.db.nodes[newnode.id] = newnode
+            ))
 
-        for old_id, node in incoming.nodes.items():
+        # children need every remapped id, so wiring stays a second pass
+        for old_id, node in incoming_items:
             if node.type != "folder":
                 continue
-            self.db.nodes[id_map[old_id]].children = [id_map[c] for c in node.children if c in id_map]
+            folder = nodes[id_map[old_id]]
+            folder.children = [id_map[c] for c in node.children if c in id_map]
+            for cid in folder.children:
+                nodes[cid].parent_id = folder.id
 
         attach_under = self.db.nodes.get(self.current_folder_id)
         if not attach_under or attach_under.type != "folder":
@@ -598,14 +967,20 @@ class ExplorerView(ttk.Frame):
         qc_in = id_map.get(incoming.quickcopy_root_id)
         if qc_in and qc_in in self.db.nodes:
             attach_under.children.append(qc_in)
+            self.db.nodes[qc_in].parent_id = attach_under.id
 
         fav_in = id_map.get(incoming.favorites_root_id)
         if fav_in and fav_in in self.db.nodes:
             incoming_fav_folder = self.db.nodes[fav_in]
             my_fav = self.db.nodes[self.db.favorites_root_id]
+            # set probe instead of scanning my_fav.children per incoming id
+            existing = set(my_fav.children)
             for cid in incoming_fav_folder.children:
-                if cid not in my_fav.children:
+                if cid not in existing:
                     my_fav.children.append(cid)
+                    existing.add(cid)
+                    if cid in self.db.nodes:
+                        self.db.nodes[cid].parent_id = my_fav.id
 
         self.on_db_changed()
         self.refresh_all()
\ No newline at end of file
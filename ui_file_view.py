@@ -1,6 +1,7 @@
 ﻿# -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import hashlib
 import tkinter as tk
 from tkinter import ttk, messagebox, colorchooser, font as tkfont
 from datetime import datetime
@@ -28,14 +29,46 @@ def _now_iso() -> str:
     return datetime.now().isoformat(timespec="seconds")
 
 
+# tkfont.families() is a Tcl round-trip returning hundreds of strings; the
+# installed set doesn't change while the app runs, so fetch and sort it once.
+_FONT_FAMILIES_CACHE: list[str] | None = None
+
+
+def _get_font_families() -> list[str]:
+    global _FONT_FAMILIES_CACHE
+    if _FONT_FAMILIES_CACHE is None:
+        _FONT_FAMILIES_CACHE = sorted(set(tkfont.families()))
+    return _FONT_FAMILIES_CACHE
+
+
+# _fmt_ts runs on every title refresh, almost always with the same timestamp
+# it saw last time - remember that one (iso, formatted) pair.
+_FMT_TS_LAST: tuple[str, str] | None = None
+
+
 def _fmt_ts(iso_ts: str | None) -> str:
+    global _FMT_TS_LAST
     if not iso_ts:
         return "Never"
+    last = _FMT_TS_LAST
+    if last is not None and last[0] == iso_ts:
+        return last[1]
+    # _now_iso always yields "YYYY-MM-DDTHH:MM:SS"; slice it directly
+    # instead of building a datetime per call
     try:
-        dt = datetime.fromisoformat(iso_ts)
-        return dt.strftime("%m/%d/%Y %I:%M %p").lstrip("0").replace("/0", "/")
+        hour = int(iso_ts[11:13])
+        out = "%d/%d/%s %02d:%s %s" % (
+            int(iso_ts[5:7]),
+            int(iso_ts[8:10]),
+            iso_ts[0:4],
+            hour % 12 or 12,
+            iso_ts[14:16],
+            "PM" if hour >= 12 else "AM",
+        )
     except Exception:
         return iso_ts
+    _FMT_TS_LAST = (iso_ts, out)
+    return out
 
 
 class FileView(ttk.Frame):
@@ -58,14 +91,38 @@ class FileView(ttk.Frame):
         self.block_widgets: list[dict] = []
         self.active_text_widget: tk.Text | None = None
 
-        # Dirty tracking
-        self._last_saved_signature: tuple | None = None
+        # Incremental block mounting: docs not yet turned into widgets wait
+        # here; a generation counter cancels stale after_idle chunks when a
+        # new file is opened mid-mount.
+        self._unmounted_docs: list[dict] = []
+        self._mount_idle_id = None
+        # extract_rich_doc result per Text widget, dropped whenever that
+        # widget changes - clean widgets skip the tag-table walk on every
+        # collect/signature pass
+        self._doc_cache: dict[tk.Text, dict] = {}
+        # last states pushed to Tk, so repeat _apply_lock_state_ui calls
+        # skip the no-op configure round-trips
+        self._applied_lock_state = None
+        self._fmt_toolbar_state = None
+        self._last_title_text = None
+        self._last_saved_text = None
+        self._fav_by_target: dict[str, str] = {}
+        self._fav_child_pos: dict[str, int] = {}
+        self._fav_root: Node | None = None
+        self._mount_generation = 0
+        self._mounting = False
+
+        # Dirty tracking (event-driven: <<Modified>> on each Text widget).
+        # _modified_since_save is a cheap hint: while False, _is_dirty can
+        # answer without hashing any content.
+        self._last_saved_signature: bytes | None = None
         self._suspend_dirty_watch = False
-        self._dirty_poll_job = None
+        self._dirty_debounce_job = None
+        self._modified_since_save = False
 
-        # Autosave loop
+        # Debounced autosave: one save per typing pause, nothing while idle
         self._autosave_job = None
-        self._autosave_interval_ms = 8000  # feels good; change if you want (8s)
+        self._autosave_delay_ms = 1500
 
         # Saved feedback fade
         self._saved_fade_job = None
@@ -136,7 +193,7 @@ class FileView(ttk.Frame):
 
         ttk.Label(fmt, text="Font:").pack(side="left")
         self.font_var = tk.StringVar(value="Segoe UI")
-        families = sorted(set(tkfont.families()))
+        families = _get_font_families()
         self.font_box = ttk.Combobox(fmt, textvariable=self.font_var, values=families, width=22, state="readonly")
         self.font_box.pack(side="left", padx=(6, 10))
         self.font_box.bind("<<ComboboxSelected>>", lambda e: self._apply_font_family())
@@ -173,7 +230,14 @@ class FileView(ttk.Frame):
 
         self.read_text = tk.Text(read_wrap, wrap="word", height=10)
         self.read_text.pack(side="left", fill="both", expand=True)
-        ensure_base_tags(self.read_text)
+        # One bold font for every Text in this view - ensure_base_tags would
+        # otherwise copy the base font per widget (a Tcl font object each).
+        _base = tkfont.nametofont(self.read_text.cget("font"))
+        self._bold_font = _base.copy()
+        self._bold_font.configure(weight="bold")
+        ensure_base_tags(self.read_text, bold_font=self._bold_font)
+        self.read_text.edit_modified(False)
+        self.read_text.bind("<<Modified>>", self._on_text_modified)
 
         self.read_scroll = ttk.Scrollbar(read_wrap, orient="vertical", command=self.read_text.yview)
         self.read_scroll.pack(side="right", fill="y")
@@ -191,7 +255,7 @@ class FileView(ttk.Frame):
         self.scroll = ttk.Scrollbar(copy_frame, orient="vertical", command=self.canvas.yview)
         self.inner = ttk.Frame(self.canvas)
 
-        self.inner.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+        self.inner.bind("<Configure>", self._on_inner_configure)
         self.canvas_window = self.canvas.create_window((0, 0), window=self.inner, anchor="nw")
         self.canvas.configure(yscrollcommand=self.scroll.set)
 
@@ -217,6 +281,9 @@ class FileView(ttk.Frame):
         # Mousewheel behavior for FileView-only widgets
         self._install_local_mousewheel()
 
+        # Flush a pending autosave when the window loses focus
+        self.winfo_toplevel().bind("<FocusOut>", self._on_app_focus_out, add="+")
+
         # Default unlocked/editable
         self._apply_lock_state_ui(locked=False)
 
@@ -271,77 +338,92 @@ class FileView(ttk.Frame):
             pass
 
     def _install_local_mousewheel(self):
-        # Canvas should scroll with mousewheel when hovered
-        self.canvas.bind("<Enter>", lambda e: self._bind_canvas_wheel(True))
-        self.canvas.bind("<Leave>", lambda e: self._bind_canvas_wheel(False))
-        self.inner.bind("<Enter>", lambda e: self._bind_canvas_wheel(True))
-        self.inner.bind("<Leave>", lambda e: self._bind_canvas_wheel(False))
+        # The canvas binds its own wheel events - no bind_all capture and no
+        # winfo_containing round-trip per tick. Frames inside the scroll area
+        # pick up the canvas bindtag so wheel events over them scroll too;
+        # Text widgets keep handling (and breaking) their own wheel events.
+        self.canvas.bind("<MouseWheel>", self._on_canvas_mousewheel)
+        self.canvas.bind("<Button-4>", self._on_canvas_linux_up)
+        self.canvas.bind("<Button-5>", self._on_canvas_linux_down)
+        self._share_canvas_wheel(self.inner)
 
-        # Each Text widget should scroll itself
         self._bind_text_wheel(self.read_text)
 
-    def _bind_canvas_wheel(self, enable: bool):
-        if enable:
-            self.canvas.bind_all("<MouseWheel>", self._on_canvas_mousewheel, add="+")
-            self.canvas.bind_all("<Button-4>", self._on_canvas_linux_up, add="+")
-            self.canvas.bind_all("<Button-5>", self._on_canvas_linux_down, add="+")
-        else:
-            # Don't aggressively unbind_all; it could remove other global handlers.
-            # We'll just ignore if not inside canvas based on pointer location in handler.
-            pass
+    def _share_canvas_wheel(self, widget):
+        widget.bindtags((str(self.canvas),) + widget.bindtags())
 
     def _on_canvas_mousewheel(self, event):
-        # Only scroll canvas if mouse is over the canvas region (or inner)
-        w = self.winfo_containing(event.x_root, event.y_root)
-        if not w:
-            return
-        if w == self.canvas or str(w).startswith(str(self.inner)) or str(w).startswith(str(self.canvas)):
-            self.canvas.yview_scroll(-1 * int(event.delta / 120) * 3, "units")
+        self.canvas.yview_scroll(-1 * int(event.delta / 120) * 3, "units")
+        self._mount_more_if_scrolled()
 
-    def _on_canvas_linux_up(self, event):
-        w = self.winfo_containing(event.x_root, event.y_root)
-        if not w:
-            return
-        if w == self.canvas or str(w).startswith(str(self.inner)) or str(w).startswith(str(self.canvas)):
-            self.canvas.yview_scroll(-3, "units")
+    def _on_canvas_linux_up(self, _event):
+        self.canvas.yview_scroll(-3, "units")
 
-    def _on_canvas_linux_down(self, event):
-        w = self.winfo_containing(event.x_root, event.y_root)
-        if not w:
-            return
-        if w == self.canvas or str(w).startswith(str(self.inner)) or str(w).startswith(str(self.canvas)):
-            self.canvas.yview_scroll(3, "units")
+    def _on_canvas_linux_down(self, _event):
+        self.canvas.yview_scroll(3, "units")
+        self._mount_more_if_scrolled()
+
+    # One bound method per event instead of three fresh closures per Text
+    # widget; event.widget identifies the target, and the bindings die with
+    # the widget when _mount_blocks churns rows.
+    def _on_text_wheel(self, ev):
+        ev.widget.yview_scroll(-3 if ev.delta > 0 else 3, "units")
+        return "break"
+
+    def _on_text_wheel_up(self, ev):
+        ev.widget.yview_scroll(-3, "units")
+        return "break"
+
+    def _on_text_wheel_down(self, ev):
+        ev.widget.yview_scroll(3, "units")
+        return "break"
 
     def _bind_text_wheel(self, text_widget: tk.Text):
-        def on_wheel(ev):
-            # scroll the text widget itself
-            if ev.delta > 0:
-                text_widget.yview_scroll(-3, "units")
-            else:
-                text_widget.yview_scroll(3, "units")
-            return "break"
-
-        def on_up(ev):
-            text_widget.yview_scroll(-3, "units")
-            return "break"
-
-        def on_down(ev):
-            text_widget.yview_scroll(3, "units")
-            return "break"
-
-        text_widget.bind("<MouseWheel>", on_wheel)
-        text_widget.bind("<Button-4>", on_up)
-        text_widget.bind("<Button-5>", on_down)
+        text_widget.bind("<MouseWheel>", self._on_text_wheel)
+        text_widget.bind("<Button-4>", self._on_text_wheel_up)
+        text_widget.bind("<Button-5>", self._on_text_wheel_down)
 
     def _bind_hotkeys(self):
-        self.bind_all("<Control-s>", lambda e: self._save())
+        # bind_all bindings survive the view being destroyed and leak into
+        # whatever is shown next. The toplevel sits in every descendant's
+        # bindtags, so binding there keeps the hotkeys window-scoped, and
+        # the funcids let us remove exactly our handlers on <Destroy>.
+        top = self.winfo_toplevel()
+        self._hotkey_funcids = [
+            ("<Control-s>", top.bind("<Control-s>", lambda e: self._save(), add="+")),
+            # One dispatcher for Ctrl+1..9 instead of nine separate bindings.
+            ("<Control-KeyPress>", top.bind("<Control-KeyPress>", self._on_ctrl_key, add="+")),
+        ]
+        self.bind("<Destroy>", self._unbind_hotkeys, add="+")
+
+    def _on_ctrl_key(self, event):
         # Copy blocks quickly: Ctrl+1..9
-        for i in range(1, 10):
-            self.bind_all(f"<Control-Key-{i}>", lambda e, idx=i - 1: self._copy_block(idx))
+        ks = event.keysym
+        if len(ks) == 1 and "1" <= ks <= "9":
+            self._copy_block(int(ks) - 1)
+
+    def _unbind_hotkeys(self, event=None):
+        if event is not None and event.widget is not self:
+            return
+        try:
+            top = self.winfo_toplevel()
+        except Exception:
+            return
+        for seq, funcid in getattr(self, "_hotkey_funcids", []):
+            try:
+                top.unbind(seq, funcid)
+            except Exception:
+                pass
+        self._hotkey_funcids = []
 
     def _on_canvas_configure(self, event):
         self.canvas.itemconfig(self.canvas_window, width=event.width)
 
+    def _on_inner_configure(self, _evt=None):
+        if self._mounting:
+            return  # recomputed once when the last chunk lands
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
     # ---------- Open / Render ----------
     def open_file(self, file_id: str, return_state: dict | None = None):
         # If switching files and current has unsaved changes, prompt
@@ -355,7 +437,7 @@ class FileView(ttk.Frame):
         node = self.db.nodes.get(file_id)
         if not node or node.type != "file":
             messagebox.showerror("Error", "File not found.")
-            self._force_stop_dirty_poll()
+            self._cancel_dirty_debounce()
             self._back(force=True)
             return
 
@@ -363,13 +445,14 @@ class FileView(ttk.Frame):
             node.content = FileContent()
 
         self._render_from_content(node)
+        # favorites may have changed from the explorer since the last open
+        self._rebuild_fav_index()
         self._refresh_fav_button()
 
         self._last_saved_signature = self._compute_signature_from_node(node)
-        self._start_dirty_poll()
-
-        # Start autosave loop if enabled for this file
-        self._restart_autosave_loop()
+        self._modified_since_save = False
+        self._cancel_dirty_debounce()
+        self._cancel_autosave_job()  # nothing typed in this file yet
 
     def _render_from_content(self, node: Node):
         self._suspend_dirty_watch = True
@@ -384,21 +467,15 @@ class FileView(ttk.Frame):
             self.lock_var.set(bool(self._meta[_LOCK_KEY]))
             self.autosave_var.set(bool(self._meta[_AUTOSAVE_KEY]))
 
-            # Apply docs
+            # Apply docs. apply_rich_doc leaves read_text "normal", so the
+            # cached lock state no longer reflects the widget - drop it.
             apply_rich_doc(self.read_text, content.read_doc)
-            ensure_base_tags(self.read_text)
+            ensure_base_tags(self.read_text, bold_font=self._bold_font)
+            self._applied_lock_state = None
 
             # Blocks
-            for w in self.inner.winfo_children():
-                w.destroy()
-            self.block_widgets.clear()
-
             docs = content.copy_docs[:] if content.copy_docs else []
-            if not docs:
-                docs = [{"text": "", "tags": []}]
-
-            for i, doc in enumerate(docs, start=1):
-                self._create_block_row(index=i, doc=doc)
+            self._mount_blocks(docs)
 
             self.canvas.yview_moveto(0)
             self.active_text_widget = self.read_text
@@ -416,8 +493,8 @@ class FileView(ttk.Frame):
     # ---------- Title / last saved / dirty ----------
     def _update_title_and_saved_label(self):
         if not self.file_id:
-            self.lbl_title.config(text="")
-            self.lbl_last_saved.config(text="")
+            self._set_title_text("")
+            self._set_last_saved_text("")
             return
 
         node = self.db.nodes.get(self.file_id)
@@ -428,20 +505,38 @@ class FileView(ttk.Frame):
         dirty = self._is_dirty()
         suffix = " (Unsaved)" if dirty else ""
 
-        self.lbl_title.config(text=f"{icon}{name}{suffix}")
-        self.lbl_last_saved.config(text=f"Last saved: {_fmt_ts(self._meta.get(_LAST_SAVED_KEY))}")
+        self._set_title_text(f"{icon}{name}{suffix}")
+        self._set_last_saved_text(f"Last saved: {_fmt_ts(self._meta.get(_LAST_SAVED_KEY))}")
+
+    # label.config(text=...) makes Tk recompute geometry even for identical
+    # text; these run on every keystroke settle, so skip unchanged values
+    def _set_title_text(self, text: str):
+        if text != self._last_title_text:
+            self._last_title_text = text
+            self.lbl_title.config(text=text)
+
+    def _set_last_saved_text(self, text: str):
+        if text != self._last_saved_text:
+            self._last_saved_text = text
+            self.lbl_last_saved.config(text=text)
 
     # ---------- Lock (persisted per-file) ----------
     def _on_lock_toggled(self):
         locked = bool(self.lock_var.get())
         self._meta[_LOCK_KEY] = locked
+        self._modified_since_save = True  # meta is part of the saved content
         self._apply_lock_state_ui(locked=locked)
         self._update_title_and_saved_label()
 
     def _on_autosave_toggled(self):
         enabled = bool(self.autosave_var.get())
         self._meta[_AUTOSAVE_KEY] = enabled
-        self._restart_autosave_loop()
+        self._modified_since_save = True  # meta is part of the saved content
+        if not enabled:
+            self._cancel_autosave_job()
+        elif self._is_dirty():
+            # pick up edits made before the toggle
+            self._autosave_job = self.after(self._autosave_delay_ms, self._autosave_now)
 
     def _apply_lock_state_ui(self, locked: bool):
         editable = not locked
@@ -450,16 +545,21 @@ class FileView(ttk.Frame):
         # subtle visual feedback
         bg = "#f0f0f0" if locked else "white"
 
-        # Text widgets
-        self.read_text.configure(state=state, background=bg)
+        # Each configure is a Tcl round-trip even when nothing changes, and
+        # this runs on every open/toggle/remount - skip widgets that are
+        # already in the requested state.
+        if self._applied_lock_state != state:
+            self._applied_lock_state = state
+            self.read_text.configure(state=state, background=bg)
+            self.btn_add_block.configure(state=state)
         for bw in self.block_widgets:
+            if bw.get("_lock_state") == state:
+                continue
+            bw["_lock_state"] = state
             bw["text"].configure(state=state, background=bg)
-            bw["remove_btn"].configure(state=("normal" if editable else "disabled"))
-            bw["up_btn"].configure(state=("normal" if editable else "disabled"))
-            bw["down_btn"].configure(state=("normal" if editable else "disabled"))
-
-        # Add block
-        self.btn_add_block.configure(state=("normal" if editable else "disabled"))
+            bw["remove_btn"].configure(state=state)
+            bw["up_btn"].configure(state=state)
+            bw["down_btn"].configure(state=state)
 
         # Formatting
         self._set_format_toolbar_enabled(editable)
@@ -471,12 +571,15 @@ class FileView(ttk.Frame):
     def _create_block_row(self, index: int, doc: dict):
         row = ttk.Frame(self.inner, padding=(8, 8, 8, 0))
         row.pack(fill="x")
+        self._share_canvas_wheel(row)
 
         header = ttk.Frame(row)
         header.pack(fill="x")
+        self._share_canvas_wheel(header)
 
         lbl = ttk.Label(header, text=f"Copy section {index}", font=("Segoe UI", 10, "bold"))
         lbl.pack(side="left")
+        self._share_canvas_wheel(lbl)
 
         # Reorder buttons
         btn_down = ttk.Button(header, text="↓", width=3, command=lambda: self._move_block(index - 1, +1))
@@ -496,8 +599,10 @@ class FileView(ttk.Frame):
 
         txtbox = tk.Text(text_wrap, wrap="word", height=6)
         txtbox.pack(side="left", fill="x", expand=True)
-        ensure_base_tags(txtbox)
+        # apply first: it deletes every custom tag, which would wipe the
+        # base tags ensure_base_tags just configured
         apply_rich_doc(txtbox, doc)
+        ensure_base_tags(txtbox, bold_font=self._bold_font)
 
         sb = ttk.Scrollbar(text_wrap, orient="vertical", command=txtbox.yview)
         sb.pack(side="right", fill="y")
@@ -507,10 +612,18 @@ class FileView(ttk.Frame):
         txtbox.bind("<FocusIn>", lambda e, t=txtbox: self._set_active_text(t))
         txtbox.bind("<Button-1>", lambda e, t=txtbox: self._set_active_text(t))
         txtbox.bind("<Button-3>", lambda e, t=txtbox: self._show_text_menu(e, t))
+        txtbox.edit_modified(False)
+        txtbox.bind("<<Modified>>", self._on_text_modified)
         self._bind_text_wheel(txtbox)
 
+        # every visible descendant shares the canvas wheel bindtag, so the
+        # pointer can rest anywhere in the row and still scroll the list
+        for w in (btn_copy, btn_remove, btn_up, btn_down):
+            self._share_canvas_wheel(w)
+
         sep = ttk.Separator(self.inner)
         sep.pack(fill="x", pady=(10, 0))
+        self._share_canvas_wheel(sep)
 
         self.block_widgets.append(
             {
@@ -526,11 +639,14 @@ class FileView(ttk.Frame):
             }
         )
 
-        # Apply current lock state
-        txtbox.configure(state=("disabled" if self.lock_var.get() else "normal"))
-        btn_remove.configure(state=("disabled" if self.lock_var.get() else "normal"))
-        btn_up.configure(state=("disabled" if self.lock_var.get() else "normal"))
-        btn_down.configure(state=("disabled" if self.lock_var.get() else "normal"))
+        # Apply current lock state, background included - rows mounted from
+        # the idle chunks land after _apply_lock_state_ui already ran
+        locked = bool(self.lock_var.get())
+        state = "disabled" if locked else "normal"
+        txtbox.configure(state=state, background=("#f0f0f0" if locked else "white"))
+        btn_remove.configure(state=state)
+        btn_up.configure(state=state)
+        btn_down.configure(state=state)
 
     def _set_active_text(self, widget: tk.Text):
         self.active_text_widget = widget
@@ -554,7 +670,7 @@ class FileView(ttk.Frame):
             return
         self._create_block_row(index=len(self.block_widgets) + 1, doc={"text": "", "tags": []})
         self._renumber_blocks()
-        self._update_title_and_saved_label()
+        self._mark_modified()  # an empty block raises no <<Modified>>
 
     def _remove_block(self, idx: int):
         if self.lock_var.get():
@@ -565,11 +681,12 @@ class FileView(ttk.Frame):
         if idx < 0 or idx >= len(self.block_widgets):
             return
         bw = self.block_widgets[idx]
+        self._doc_cache.pop(bw["text"], None)
         bw["row"].destroy()
         bw["sep"].destroy()
         self.block_widgets.pop(idx)
         self._renumber_blocks()
-        self._update_title_and_saved_label()
+        self._mark_modified()  # destroying a block raises no <<Modified>>
 
     def _move_block(self, idx: int, direction: int):
         if self.lock_var.get():
@@ -578,31 +695,81 @@ class FileView(ttk.Frame):
         if new_idx < 0 or new_idx >= len(self.block_widgets):
             return
 
-        # Capture current docs from UI, reorder, then rebuild blocks
-        docs = [extract_rich_doc(bw["text"]) for bw in self.block_widgets]
-        docs[idx], docs[new_idx] = docs[new_idx], docs[idx]
-
-        # Rebuild UI blocks in new order
-        self._rebuild_blocks(docs)
+        # Swap just the two affected docs between their existing widgets -
+        # no destroy/create churn, no re-mounting every other block.
+        a = self.block_widgets[idx]["text"]
+        b = self.block_widgets[new_idx]["text"]
+        doc_a = extract_rich_doc(a)
+        doc_b = extract_rich_doc(b)
+        # not suspending the dirty watch: a reorder is a real edit, and the
+        # <<Modified>> events it raises drive the title update and autosave
+        apply_rich_doc(a, doc_b)
+        apply_rich_doc(b, doc_a)
+        # apply_rich_doc deletes every custom tag, base tags included -
+        # restore them or Bold/Underline go dead on the swapped widgets
+        ensure_base_tags(a, bold_font=self._bold_font)
+        ensure_base_tags(b, bold_font=self._bold_font)
+
+    _MOUNT_CHUNK = 4
+
+    def _mount_blocks(self, docs: list[dict]):
+        """Replace all block rows. The first few mount synchronously so the
+        view paints immediately; the rest arrive in after_idle chunks, with
+        scrollregion recomputed once at the end instead of per row."""
+        self._mount_generation += 1
+        gen = self._mount_generation
+
+        for w in self.inner.winfo_children():
+            w.destroy()
+        self.block_widgets.clear()
+        self._doc_cache.clear()
+
+        if not docs:
+            docs = [{"text": "", "tags": []}]
+
+        head = docs[:self._MOUNT_CHUNK]
+        self._unmounted_docs = list(docs[self._MOUNT_CHUNK:])
+
+        self._mounting = bool(self._unmounted_docs)
+        for i, doc in enumerate(head, start=1):
+            self._create_block_row(index=i, doc=doc)
+        if self._unmounted_docs:
+            self._mount_idle_id = self.after_idle(self._mount_chunk, gen)
+        else:
+            self._on_inner_configure()
 
-    def _rebuild_blocks(self, docs: list[dict]):
+    def _mount_chunk(self, gen: int):
+        if gen != self._mount_generation or not self.winfo_exists():
+            return  # a newer render replaced this mount
+        self._mount_idle_id = None
         self._suspend_dirty_watch = True
         try:
-            for w in self.inner.winfo_children():
-                w.destroy()
-            self.block_widgets.clear()
-
-            if not docs:
-                docs = [{"text": "", "tags": []}]
-
-            for i, doc in enumerate(docs, start=1):
+            chunk = self._unmounted_docs[:self._MOUNT_CHUNK]
+            del self._unmounted_docs[:self._MOUNT_CHUNK]
+            base = len(self.block_widgets)
+            for i, doc in enumerate(chunk, start=base + 1):
                 self._create_block_row(index=i, doc=doc)
-
-            self.canvas.yview_moveto(0)
-            self._apply_lock_state_ui(locked=self.lock_var.get())
-            self._update_title_and_saved_label()
         finally:
             self._suspend_dirty_watch = False
+        if self._unmounted_docs:
+            self._mount_idle_id = self.after_idle(self._mount_chunk, gen)
+        else:
+            self._mounting = False
+            self._on_inner_configure()
+
+    def _mount_more_if_scrolled(self):
+        # Scrolling can outrun the idle mounting and reach the gap below the
+        # last mounted row. When the viewport nears the bottom of what is
+        # mounted, pull the next chunk in now instead of waiting for idle.
+        if not self._unmounted_docs:
+            return
+        _, hi = self.canvas.yview()
+        if hi < 0.8:
+            return
+        if self._mount_idle_id is not None:
+            self.after_cancel(self._mount_idle_id)
+            self._mount_idle_id = None
+        self._mount_chunk(self._mount_generation)
 
     # ---------- Formatting ----------
     def _active_text(self) -> tk.Text | None:
@@ -610,6 +777,9 @@ class FileView(ttk.Frame):
 
     def _set_format_toolbar_enabled(self, enabled: bool):
         state = "normal" if enabled else "disabled"
+        if state == self._fmt_toolbar_state:
+            return
+        self._fmt_toolbar_state = state
         for w in (self.font_box, self.size_box, self.btn_bold, self.btn_under, self.btn_color, self.btn_clear):
             try:
                 w.configure(state=state)
@@ -623,6 +793,7 @@ class FileView(ttk.Frame):
         if not t:
             return
         toggle_tag_on_selection(t, tag)
+        self._mark_modified(t)
 
     def _apply_font_family(self):
         if self.lock_var.get():
@@ -632,6 +803,7 @@ class FileView(ttk.Frame):
             return
         family = self.font_var.get()
         set_font_family_on_selection(t, family)
+        self._mark_modified(t)
 
     def _apply_font_size(self):
         if self.lock_var.get():
@@ -644,6 +816,7 @@ class FileView(ttk.Frame):
         except Exception:
             return
         set_font_size_on_selection(t, size)
+        self._mark_modified(t)
 
     def _choose_color(self):
         if self.lock_var.get():
@@ -655,6 +828,7 @@ class FileView(ttk.Frame):
         if not col or not col[1]:
             return
         set_color_on_selection(t, col[1])
+        self._mark_modified(t)
 
     def _clear_formatting(self):
         if self.lock_var.get():
@@ -663,11 +837,23 @@ class FileView(ttk.Frame):
         if not t:
             return
         clear_formatting_on_selection(t)
+        self._mark_modified(t)
 
     # ---------- Save / Dirty ----------
     def _collect_content_from_ui(self) -> FileContent:
-        read_doc = extract_rich_doc(self.read_text)
-        copy_docs = [extract_rich_doc(bw["text"]) for bw in self.block_widgets]
+        cache = self._doc_cache
+        read_doc = cache.get(self.read_text)
+        if read_doc is None:
+            read_doc = cache[self.read_text] = extract_rich_doc(self.read_text)
+        copy_docs = []
+        for bw in self.block_widgets:
+            t = bw["text"]
+            doc = cache.get(t)
+            if doc is None:
+                doc = cache[t] = extract_rich_doc(t)
+            copy_docs.append(doc)
+        # docs whose widgets haven't mounted yet are passed through untouched
+        copy_docs.extend(self._unmounted_docs)
         if not copy_docs:
             copy_docs = [{"text": "", "tags": []}]
 
@@ -680,43 +866,47 @@ class FileView(ttk.Frame):
 
         return FileContent(read_doc=read_doc, copy_docs=copy_docs)
 
-    def _compute_signature_from_content(self, content: FileContent) -> tuple:
-        read = content.read_doc if isinstance(content.read_doc, dict) else {"text": "", "tags": []}
-        locked = bool(read.get(_LOCK_KEY, False))
-        autosave = bool(read.get(_AUTOSAVE_KEY, False))
-        last_saved = read.get(_LAST_SAVED_KEY, None)
-
-        read_text = (read.get("text") or "")
-        read_tags = tuple(self._freeze_tags(read.get("tags") or []))
-
-        copy_docs = content.copy_docs or []
-        frozen_copy = []
-        for d in copy_docs:
-            if not isinstance(d, dict):
-                d = {"text": "", "tags": []}
-            frozen_copy.append(((d.get("text") or ""), tuple(self._freeze_tags(d.get("tags") or []))))
-
-        return (locked, autosave, last_saved, read_text, read_tags, tuple(frozen_copy))
+    def _compute_signature_from_content(self, content: FileContent) -> bytes:
+        # Stream everything through one blake2b digest: a dirty check then
+        # compares 16 bytes instead of deep tuple trees of stringified tags.
+        h = hashlib.blake2b(digest_size=16)
+        read = content.read_doc if isinstance(content.read_doc, dict) else {}
+        meta = (
+            bool(read.get(_LOCK_KEY, False)),
+            bool(read.get(_AUTOSAVE_KEY, False)),
+            read.get(_LAST_SAVED_KEY, None),
+        )
+        h.update(repr(meta).encode("utf-8"))
+        self._hash_doc(h, read)
+        for d in (content.copy_docs or []):
+            h.update(b"\x00doc")
+            self._hash_doc(h, d if isinstance(d, dict) else {})
+        return h.digest()
+
+    @staticmethod
+    def _hash_doc(h, doc: dict):
+        up = h.update
+        text = (doc.get("text") or "").encode("utf-8")
+        up(len(text).to_bytes(4, "little"))
+        up(text)
+        # Tags come from extract_rich_doc (or the same shape loaded from
+        # disk), so trust the schema: one repr + one hash update per tag
+        # instead of a per-key/per-range Python loop. repr is deterministic
+        # for the str/int/list values these dicts hold.
+        for t in (doc.get("tags") or []):
+            try:
+                canon = (t["name"], sorted(t["config"].items()), t["ranges"])
+            except (TypeError, KeyError, AttributeError):
+                continue  # malformed tag entry - skip, as before
+            up(b"\x01")
+            up(repr(canon).encode("utf-8"))
 
-    def _freeze_tags(self, tags_list) -> list:
-        out = []
-        for t in (tags_list or []):
-            if not isinstance(t, dict):
-                continue
-            name = t.get("name") or ""
-            cfg = t.get("config") or {}
-            ranges = t.get("ranges") or []
-            cfg_items = tuple(sorted((str(k), str(v)) for k, v in cfg.items()))
-            rng_items = tuple(tuple(map(str, r)) for r in ranges if isinstance(r, (list, tuple)) and len(r) == 2)
-            out.append((str(name), cfg_items, rng_items))
-        return out
-
-    def _compute_signature_from_node(self, node: Node) -> tuple:
+    def _compute_signature_from_node(self, node: Node) -> bytes:
         if not node.content:
             node.content = FileContent()
         return self._compute_signature_from_content(node.content)
 
-    def _compute_current_signature(self) -> tuple | None:
+    def _compute_current_signature(self) -> bytes | None:
         if not self.file_id:
             return None
         try:
@@ -730,10 +920,18 @@ class FileView(ttk.Frame):
             return False
         if not self.file_id:
             return False
+        if not self._modified_since_save:
+            return False  # no widget reported an edit - skip the hashing
         cur = self._compute_current_signature()
         if cur is None or self._last_saved_signature is None:
             return False
-        return cur != self._last_saved_signature
+        if cur == self._last_saved_signature:
+            # content is back to its saved state (e.g. an edit was undone) -
+            # drop the hint so the next checks are O(1) again until the
+            # next <<Modified>>
+            self._modified_since_save = False
+            return False
+        return True
 
     def _save(self, _autosave: bool = False):
         if not self.file_id:
@@ -747,9 +945,11 @@ class FileView(ttk.Frame):
             self._meta[_LAST_SAVED_KEY] = _now_iso()
 
             node.content = self._collect_content_from_ui()
-            self.on_db_changed()
+            # report which node changed so storage can flush just this shard
+            self.on_db_changed(self.file_id)
 
             self._last_saved_signature = self._compute_signature_from_node(node)
+            self._modified_since_save = False
             self._refresh_fav_button()
             self._update_title_and_saved_label()
 
@@ -759,57 +959,80 @@ class FileView(ttk.Frame):
                 messagebox.showerror("Save error", f"Could not save:\n\n{e}")
 
     def _show_saved_feedback(self):
-        # Smooth-ish fade: show ✓ Saved and fade out by changing the text color to match background-ish
+        # One timer per save: show ✓ Saved, clear it after a moment. Skip
+        # entirely when the label isn't visible (e.g. autosave mid-switch).
+        try:
+            if not self.lbl_saved.winfo_viewable():
+                return
+        except Exception:
+            return
+
         if self._saved_fade_job is not None:
             try:
                 self.after_cancel(self._saved_fade_job)
             except Exception:
                 pass
-            self._saved_fade_job = None
 
         self.lbl_saved.config(text="✓ Saved", foreground="#1a7f37")  # subtle green
+        self._saved_fade_job = self.after(1200, self._clear_saved_feedback)
 
-        steps = [
-            (700, "#1a7f37"),   # stay green briefly
-            (1100, "#5a5a5a"),  # fade to gray
-            (1500, ""),         # clear
-        ]
-
-        def run_step(i=0):
-            if i >= len(steps):
-                return
-            delay, color = steps[i]
-            if color == "":
-                self.lbl_saved.config(text="")
-                return
-            self.lbl_saved.config(foreground=color)
-            self._saved_fade_job = self.after(delay, lambda: run_step(i + 1))
+    def _clear_saved_feedback(self):
+        self._saved_fade_job = None
+        self.lbl_saved.config(text="")
 
-        run_step(0)
+    # Event-driven dirty indicator: Tk raises <<Modified>> on each Text once
+    # per edit burst (until the flag is reset), so idle files cost nothing -
+    # no polling, no signature recomputation while nothing changes.
+    def _on_text_modified(self, event):
+        try:
+            event.widget.edit_modified(False)  # re-arm for the next edit
+        except Exception:
+            pass
+        # drop the cached extraction even for suspended (programmatic) edits
+        self._doc_cache.pop(event.widget, None)
+        if self._suspend_dirty_watch:
+            return
+        self._modified_since_save = True
+        if self._dirty_debounce_job is not None:
+            try:
+                self.after_cancel(self._dirty_debounce_job)
+            except Exception:
+                pass
+        self._dirty_debounce_job = self.after(250, self._on_dirty_settled)
 
-    # Poll to keep title updated as user types (dirty indicator)
-    def _start_dirty_poll(self):
-        self._force_stop_dirty_poll()
+        # autosave rides the same event: reschedule on every edit so the
+        # save lands one pause after the last keystroke
+        if self.file_id and bool(self.autosave_var.get()):
+            self._cancel_autosave_job()
+            self._autosave_job = self.after(self._autosave_delay_ms, self._autosave_now)
 
-        def tick():
-            if not self.winfo_exists() or not self.file_id:
-                return
-            if not self._suspend_dirty_watch:
-                self._update_title_and_saved_label()
-            self._dirty_poll_job = self.after(400, tick)
+    def _on_dirty_settled(self):
+        self._dirty_debounce_job = None
+        if not self.winfo_exists() or not self.file_id:
+            return
+        self._update_title_and_saved_label()
 
-        self._dirty_poll_job = self.after(400, tick)
+    def _mark_modified(self, widget=None):
+        # For edits Tk doesn't report via <<Modified>> (tag changes, block
+        # add/remove): set the hint and mirror the handler's follow-up work.
+        if widget is not None:
+            self._doc_cache.pop(widget, None)
+        self._modified_since_save = True
+        self._update_title_and_saved_label()
+        if self.file_id and bool(self.autosave_var.get()):
+            self._cancel_autosave_job()
+            self._autosave_job = self.after(self._autosave_delay_ms, self._autosave_now)
 
-    def _force_stop_dirty_poll(self):
-        if self._dirty_poll_job is not None:
+    def _cancel_dirty_debounce(self):
+        if self._dirty_debounce_job is not None:
             try:
-                self.after_cancel(self._dirty_poll_job)
+                self.after_cancel(self._dirty_debounce_job)
             except Exception:
                 pass
-        self._dirty_poll_job = None
+            self._dirty_debounce_job = None
 
     # ---------- Autosave ----------
-    def _restart_autosave_loop(self):
+    def _cancel_autosave_job(self):
         if self._autosave_job is not None:
             try:
                 self.after_cancel(self._autosave_job)
@@ -817,32 +1040,37 @@ class FileView(ttk.Frame):
                 pass
             self._autosave_job = None
 
-        if not self.file_id:
+    def _autosave_now(self):
+        self._autosave_job = None
+        if not self.winfo_exists() or not self.file_id:
             return
+        if bool(self.autosave_var.get()) and self._is_dirty():
+            self._save(_autosave=True)
 
-        if not bool(self.autosave_var.get()):
+    def _on_app_focus_out(self, event):
+        # beforeunload analog: flush pending work when the window loses focus
+        if event.widget is not self.winfo_toplevel():
             return
-
-        def loop():
-            if not self.winfo_exists() or not self.file_id:
-                return
-            if bool(self.autosave_var.get()) and self._is_dirty():
-                self._save(_autosave=True)
-            self._autosave_job = self.after(self._autosave_interval_ms, loop)
-
-        self._autosave_job = self.after(self._autosave_interval_ms, loop)
+        if self.file_id and bool(self.autosave_var.get()) and self._is_dirty():
+            self._cancel_autosave_job()
+            self._save(_autosave=True)
 
     # ---------- Prompt on exit ----------
     def _prompt_save_if_dirty(self) -> bool:
         if not self._is_dirty():
             return True
 
-        name = ""
-        if self.file_id and self.file_id in self.db.nodes:
-            name = self.db.nodes[self.file_id].name
+        node = self.db.nodes.get(self.file_id) if self.file_id else None
+        name = node.name if node else ""
 
+        # The modal runs a nested mainloop, so a pending autosave would fire
+        # mid-prompt and save behind the user's back - park it first.
+        self._cancel_autosave_job()
         res = messagebox.askyesnocancel("Unsaved changes", f"Save changes to '{name}'?")
         if res is None:
+            # staying on the dirty file - put the autosave back
+            if bool(self.autosave_var.get()):
+                self._autosave_job = self.after(self._autosave_delay_ms, self._autosave_now)
             return False
         if res is True:
             self._save()
@@ -850,17 +1078,55 @@ class FileView(ttk.Frame):
         return True
 
     # ---------- Favorites ----------
+    def _fav_root_cached(self) -> Node | None:
+        # The favorites root id never changes after load, so resolve the
+        # node (and its type check) once and reuse it; the id guard covers
+        # the db being swapped out from under the view.
+        root = self._fav_root
+        if root is None or root.id != self.db.favorites_root_id:
+            root = self.db.nodes.get(self.db.favorites_root_id)
+            if root is not None and root.type != "folder":
+                root = None
+            self._fav_root = root
+        return root
+
+    def _rebuild_fav_index(self):
+        # file id -> shortcut id, same reverse index the explorer keeps:
+        # favorite checks become one dict probe instead of walking the
+        # favorites children on every button refresh
+        index: dict[str, str] = {}
+        pos: dict[str, int] = {}
+        fav_root = self._fav_root_cached()
+        if fav_root is not None:
+            nodes = self.db.nodes
+            for i, cid in enumerate(fav_root.children):
+                pos[cid] = i
+                n = nodes.get(cid)
+                if n and n.type == "shortcut" and n.target_id:
+                    index[n.target_id] = n.id
+        self._fav_by_target = index
+        self._fav_child_pos = pos
+
     def _is_favorited(self) -> bool:
-        if not self.file_id:
-            return False
-        fav_root = self.db.nodes.get(self.db.favorites_root_id)
-        if not fav_root or fav_root.type != "folder":
-            return False
-        for cid in fav_root.children:
-            n = self.db.nodes.get(cid)
-            if n and n.type == "shortcut" and n.target_id == self.file_id:
-                return True
-        return False
+        return bool(self.file_id) and self.file_id in self._fav_by_target
+
+    def _remove_fav_child(self, fav_root: Node, sc_id: str):
+        # Favorites order is never shown as stored (the list view sorts by
+        # name), so swap-with-last turns the O(N) list.remove into O(1).
+        children = fav_root.children
+        i = self._fav_child_pos.pop(sc_id, None)
+        if i is None or i >= len(children) or children[i] != sc_id:
+            # position map is stale - fall back to the scan
+            try:
+                children.remove(sc_id)
+            except ValueError:
+                pass
+            return
+        last = children[-1]
+        children[i] = last
+        children.pop()
+        if last != sc_id:
+            self._fav_child_pos[last] = i
 
     def _refresh_fav_button(self):
         self.fav_btn.config(text=("⭐ Favorited" if self._is_favorited() else "☆ Favorite"))
@@ -869,17 +1135,14 @@ class FileView(ttk.Frame):
         if not self.file_id:
             return
 
-        fav_root = self.db.nodes.get(self.db.favorites_root_id)
-        if not fav_root or fav_root.type != "folder":
+        fav_root = self._fav_root_cached()
+        if fav_root is None:
             return
 
-        if self._is_favorited():
-            for cid in list(fav_root.children):
-                n = self.db.nodes.get(cid)
-                if n and n.type == "shortcut" and n.target_id == self.file_id:
-                    fav_root.children.remove(cid)
-                    self.db.nodes.pop(cid, None)
-                    break
+        sc_id = self._fav_by_target.pop(self.file_id, None)
+        if sc_id is not None:
+            self._remove_fav_child(fav_root, sc_id)
+            self.db.remove_node(sc_id)
             self.on_db_changed()
             self._refresh_fav_button()
             return
@@ -888,9 +1151,11 @@ class FileView(ttk.Frame):
         if not target or target.type != "file":
             return
 
-        sc = Node(id=new_id(), type="shortcut", name=target.name, target_id=self.file_id)
-        self.db.nodes[sc.id] = sc
+        sc = Node(id=new_id(), type="shortcut", name=target.name, target_id=self.file_id, parent_id=fav_root.id)
+        self.db.add_node(sc)
         fav_root.children.append(sc.id)
+        self._fav_by_target[self.file_id] = sc.id
+        self._fav_child_pos[sc.id] = len(fav_root.children) - 1
 
         self.on_db_changed()
         self._refresh_fav_button()
@@ -899,16 +1164,13 @@ class FileView(ttk.Frame):
     def _back(self, force: bool = False):
         if not force:
             if self.file_id and self._is_dirty():
-                if not self._prompt_save_if_dirty():
+                if bool(self.autosave_var.get()):
+                    # autosave files flush silently instead of prompting
+                    self._save(_autosave=True)
+                elif not self._prompt_save_if_dirty():
                     return
 
-        self._force_stop_dirty_poll()
-
-        if self._autosave_job is not None:
-            try:
-                self.after_cancel(self._autosave_job)
-            except Exception:
-                pass
-            self._autosave_job = None
+        self._cancel_dirty_debounce()
+        self._cancel_autosave_job()
 
         self.on_back(self.return_state)
\ No newline at end of file
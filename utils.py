@@ -4,11 +4,27 @@ from tkinter import Tk
 
 
 def copy_to_clipboard(root: Tk, text: str):
+    # No update_idletasks: the clipboard needs no idle pump - Tk answers
+    # paste requests from the running event loop - and flushing here made
+    # every copy wait on whatever redraws happened to be queued.
     root.clipboard_clear()
     root.clipboard_append(text)
-    root.update_idletasks()
+
+
+# Shared bindtag for scrollable widgets. App binds the wheel events once on
+# this class tag; widgets opt in via register_scrollable and handle their own
+# events directly (event.widget), with no global hit-testing per wheel tick.
+SCROLL_WHEEL_TAG = "ScrollableWheel"
+
+
+def register_scrollable(widget):
+    widget.bindtags((SCROLL_WHEEL_TAG,) + widget.bindtags())
 
 
 def safe_name(name: str) -> str:
-    name = (name or "").strip()
+    if not name:
+        return "Untitled"
+    # most names have clean ends - only pay for strip's copy when needed
+    if name[0].isspace() or name[-1].isspace():
+        name = name.strip()
     return name if name else "Untitled"